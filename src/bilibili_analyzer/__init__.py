@@ -5,6 +5,9 @@ This package provides tools for collecting, analyzing, and visualizing
 Bilibili video content data with a focus on productivity-related topics.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "1.0.0"
 __author__ = "Bilibili Content Analyzer Contributors"
 __email__ = "contributors@example.com"
@@ -19,9 +22,17 @@ from .config import (
     OUTPUT_CONFIG,
 )
 
-from .data_analyzer import DataAnalyzer
-from .visualizer import Visualizer
-from .font_utils import setup_chinese_font, get_available_chinese_fonts, print_font_info, create_font_test_chart
+
+# 分析、可视化和字体工具依赖 jieba、textblob、matplotlib、seaborn 等较重的库，
+# 首次访问时才导入，只采集数据或只画图的进程（如图表子进程）不会加载用不到的模块
+_LAZY_EXPORTS = {
+    "DataAnalyzer": ".data_analyzer",
+    "Visualizer": ".visualizer",
+    "setup_chinese_font": ".font_utils",
+    "get_available_chinese_fonts": ".font_utils",
+    "print_font_info": ".font_utils",
+    "create_font_test_chart": ".font_utils",
+}
 
 __all__ = [
     "DataAnalyzer",
@@ -37,4 +48,10 @@ __all__ = [
     "ANALYSIS_CONFIG",
     "VISUALIZATION_CONFIG",
     "OUTPUT_CONFIG",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
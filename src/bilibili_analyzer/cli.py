@@ -9,19 +9,12 @@ import logging
 from pathlib import Path
 
 from .main import BilibiliAnalyzer
+from .logging_setup import configure_logging
 
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('logs/bilibili_analyzer.log')
-        ]
-    )
+    configure_logging(logging.DEBUG if verbose else logging.INFO)
 
 
 def main():
@@ -92,13 +85,17 @@ def main():
         logger.info(f"Starting Bilibili Content Analyzer in {args.mode} mode")
         
         if args.mode == 'collect':
-            analyzer.collect_only(force_recollect=args.force_recollect)
+            success = analyzer.collect_only(force_recollect=args.force_recollect)
         elif args.mode == 'analyze':
-            analyzer.analyze_only()
+            success = analyzer.run_data_analysis()
         elif args.mode == 'visualize':
-            analyzer.visualize_only()
+            success = analyzer.run_visualization()
         else:
-            analyzer.run_full_analysis(force_recollect=args.force_recollect)
+            success = analyzer.run_full_analysis(force_recollect=args.force_recollect)
+        
+        if not success:
+            logger.error(f"Analysis failed in {args.mode} mode")
+            sys.exit(1)
             
         logger.info("Analysis completed successfully")
         
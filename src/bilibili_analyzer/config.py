@@ -56,6 +56,7 @@ DATE_RANGE = {
 DATA_STORAGE = {
     'raw_data_dir': 'data/raw',
     'processed_data_dir': 'data/processed',
+    'cache_dir': 'data/cache',
     'output_dir': 'output',
     'logs_dir': 'logs'
 }
@@ -68,8 +69,14 @@ ANALYSIS_CONFIG = {
     },
     'min_video_duration': 60,    # 最小视频时长（秒）
     'max_results_per_keyword': 1000,  # 每个关键词最大结果数
-    'request_delay': 1,          # 请求间隔（秒）
-    'batch_size': 50             # 批处理大小
+    'rate_per_sec': 4,           # 每秒最多发出的请求数（令牌桶速率）
+    'max_retries': 3,            # 请求失败重试次数
+    'max_backoff': 30,           # 退避重试的最长等待（秒）
+    'connection_pool_size': 16,  # HTTP连接池大小
+    'concurrency': 4,            # 同时进行的搜索请求数
+    'cache_expire': 86400,       # 接口响应缓存有效期（秒）
+    'batch_size': 50,            # 批处理大小
+    'parallel_tokenize_min_texts': 5000  # 单批文本数达到该值时才开启jieba多进程分词
 }
 
 # 可视化配置
@@ -77,6 +84,8 @@ VISUALIZATION_CONFIG = {
     'figure_size': (12, 8),
     'font_family': 'SimHei',     # 中文字体
     'color_palette': 'viridis',
+    'dpi': 150,                  # PNG图表分辨率
+    'png_compress_level': 1,     # PNG压缩级别(0-9)，越低编码越快
     'wordcloud_config': {
         'width': 800,
         'height': 400,
@@ -5,60 +5,51 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import matplotlib
 import jieba
 import jieba.analyse
-from wordcloud import WordCloud
-from collections import Counter
-import json
+from collections import Counter, defaultdict
+from operator import itemgetter
+import orjson
 import os
 from datetime import datetime, timedelta
 import re
+import math
+import heapq
+import tempfile
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from textblob import TextBlob
-from snownlp import SnowNLP
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
-from .config import DATA_STORAGE, ANALYSIS_CONFIG, VISUALIZATION_CONFIG
+from .config import DATA_STORAGE, ANALYSIS_CONFIG, VISUALIZATION_CONFIG, OUTPUT_CONFIG
+from .logging_setup import configure_logging
+
+# jieba 的并行模式是进程级全局状态，多个分析线程共享同一进程池，按引用计数开关
+_parallel_lock = threading.Lock()
+_parallel_users = 0
 
 
 class DataAnalyzer:
     """Data analyzer for Bilibili content analysis."""
     
+    NUMERIC_COLUMNS = ['view', 'danmaku', 'reply', 'favorite', 'coin', 'like', 'share']
+    
+    # 参与度得分中各互动指标的权重
+    ENGAGEMENT_WEIGHTS = {'like': 3, 'coin': 5, 'favorite': 4, 'share': 6, 'reply': 2}
+    
     def __init__(self):
-        self.logger = self._setup_logger()
+        configure_logging()
+        self.logger = logging.getLogger('ExecutionDataAnalyzer')
         self._setup_chinese_font()
         self._load_stopwords()
+        self._warm_up_nlp()
         self._ensure_directories()
     
-    def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger('ExecutionDataAnalyzer')
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            log_file = os.path.join(DATA_STORAGE['logs_dir'], 'analyzer.log')
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-            
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
-            
-        return logger
-    
     def _setup_chinese_font(self):
         """设置中文字体"""
         import matplotlib.font_manager as fm
@@ -77,13 +68,13 @@ class DataAnalyzer:
                 continue
         
         if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
+            matplotlib.rcParams['font.sans-serif'] = [available_font]
             self.logger.info(f"使用字体: {available_font}")
         else:
-            plt.rcParams['font.sans-serif'] = ['DejaVu Sans']
+            matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans']
             self.logger.warning("未找到中文字体，图表中文可能显示为方框")
         
-        plt.rcParams['axes.unicode_minus'] = False
+        matplotlib.rcParams['axes.unicode_minus'] = False
     
     def _load_stopwords(self):
         """加载停用词"""
@@ -94,6 +85,183 @@ class DataAnalyzer:
             '投币', '收藏', '分享', '弹幕', '评论', '关注', 'UP主', 'up主', '播放',
             '更新', '发布', '上传', '链接', '地址', '网站', '平台', '用户', '内容'
         ])
+        
+        # 注册到jieba关键词提取器，提取时直接跳过停用词（jieba按小写比较）
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as f:
+            f.write('\n'.join(sorted({word.lower() for word in self.stopwords})))
+        try:
+            jieba.analyse.set_stop_words(f.name)
+        finally:
+            os.remove(f.name)
+    
+    def _warm_up_nlp(self):
+        """
+        预先加载jieba词典与情感词典，避免首次分析时才付出加载开销
+        
+        需在开启并行分词前调用，fork出的分词进程可直接继承已加载的词典
+        """
+        jieba.initialize()
+        self._load_sentiment_lexicon()
+    
+    @contextmanager
+    def _parallel_tokenizer(self, n_texts: int):
+        """
+        大批量分词期间临时开启jieba多进程分词（Windows不支持）
+        
+        进程池只在批量达到阈值时创建，最后一个使用方退出时关闭，
+        采集、可视化等不分词的流程不会创建进程池
+        
+        Args:
+            n_texts: 待分词的文本数
+            
+        Yields:
+            本次应使用的分词函数
+        """
+        global _parallel_users
+        processes = (os.cpu_count() or 1) - 1
+        if os.name == 'nt' or processes < 2 or n_texts < ANALYSIS_CONFIG['parallel_tokenize_min_texts']:
+            yield jieba.dt.cut
+            return
+        
+        with _parallel_lock:
+            # 进程池由外部开启时不接管其生命周期
+            external = _parallel_users == 0 and jieba.pool is not None
+            if not external:
+                if _parallel_users == 0:
+                    jieba.enable_parallel(processes)
+                    self.logger.info(f"jieba并行分词已开启，进程数: {processes}")
+                _parallel_users += 1
+        
+        if external:
+            yield jieba.cut
+            return
+        
+        try:
+            yield jieba.cut
+        finally:
+            with _parallel_lock:
+                _parallel_users -= 1
+                if _parallel_users == 0:
+                    jieba.disable_parallel()
+    
+    def _tokenize_rows(self, texts) -> List[List[str]]:
+        """
+        批量分词，结果与输入逐条对应
+        
+        所有文本以换行拼接后一次交给jieba，并行模式下jieba按行分发到各进程，
+        再按换行符将词流切回各条文本
+        
+        Args:
+            texts: 文本序列
+            
+        Returns:
+            每条文本的分词结果列表
+        """
+        texts = [text.replace('\r', ' ').replace('\n', ' ') for text in texts]
+        if not texts:
+            return []
+        
+        rows = [[]]
+        with self._parallel_tokenizer(len(texts)) as cut:
+            for word in cut('\n'.join(texts)):
+                if word == '\n':
+                    rows.append([])
+                else:
+                    rows[-1].append(word)
+        return rows
+    
+    def _load_sentiment_lexicon(self):
+        """
+        从SnowNLP情感模型构建词语极性词典
+        
+        将朴素贝叶斯模型展开为 词 -> log(P(w|pos)/P(w|neg)) 的查表，
+        标题得分即先验与各词对数似然比之和再取sigmoid，近似SnowNLP朴素贝叶斯模型的打分，
+        但避免了逐条构造SnowNLP对象。SnowNLP使用自带的snownlp.seg分词，
+        这里对jieba分词结果打分，因此两者的概率并不完全相同
+        """
+        from snownlp import normal
+        from snownlp.sentiment import classifier
+        
+        pos = classifier.classifier.d['pos']
+        neg = classifier.classifier.d['neg']
+        
+        # 未登录词在两类中均为加一平滑，比值只取决于各类总数
+        default = math.log(neg.getsum()) - math.log(pos.getsum())
+        lexicon = {}
+        for word in set(pos.samples()) | set(neg.samples()):
+            lexicon[word] = default + math.log(pos.get(word)[1]) - math.log(neg.get(word)[1])
+        
+        # SnowNLP打分前会去除停用词，这里直接令其贡献为0
+        for word in normal.stop:
+            lexicon[word] = 0.0
+        
+        self._sentiment_lexicon = lexicon
+        self._sentiment_default = default
+        self._sentiment_prior = -default
+    
+    def _score_titles(self, title_tokens: List[List[str]]) -> np.ndarray:
+        """
+        批量计算标题情感分数
+        
+        Args:
+            title_tokens: 每个标题的分词结果
+            
+        Returns:
+            情感分数数组 (0-1, 越大越积极)，空标题为0.5
+        """
+        lexicon = self._sentiment_lexicon
+        default = self._sentiment_default
+        
+        token_lists = [[w for w in words if w.strip()] for words in title_tokens]
+        lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(token_lists))
+        
+        # 展平所有词语的极性，再按所属标题聚合
+        weights = np.fromiter(
+            (lexicon.get(w, default) for tokens in token_lists for w in tokens),
+            dtype=np.float64, count=int(lengths.sum())
+        )
+        owners = np.repeat(np.arange(len(token_lists)), lengths)
+        logits = np.bincount(owners, weights=weights, minlength=len(token_lists)) + self._sentiment_prior
+        
+        scores = 1.0 / (1.0 + np.exp(-np.clip(logits, -500, 500)))
+        scores[lengths == 0] = 0.5
+        return scores
+    
+    def _keyword_tokens(self, words: List[str]):
+        """
+        过滤停用词与单字词
+        
+        Args:
+            words: 分词结果
+            
+        Yields:
+            可作为关键词的词语
+        """
+        stop_words = jieba.analyse.default_tfidf.stop_words
+        for word in words:
+            if len(word.strip()) < 2 or word.lower() in stop_words:
+                continue
+            yield word
+    
+    def _rank_keywords(self, counts: Counter, top_k: int) -> List[Tuple[str, float]]:
+        """
+        按TF-IDF权重对词频排序，权重计算方式与jieba.analyse.extract_tags一致
+        
+        Args:
+            counts: 词频统计
+            top_k: 返回的关键词数量
+            
+        Returns:
+            (关键词, 权重) 列表
+        """
+        total = sum(counts.values())
+        if not total:
+            return []
+        
+        tfidf = jieba.analyse.default_tfidf
+        idf_freq, median_idf = tfidf.idf_freq, tfidf.median_idf
+        weights = ((word, count * idf_freq.get(word, median_idf) / total) for word, count in counts.items())
+        return heapq.nlargest(top_k, weights, key=itemgetter(1))
     
     def _ensure_directories(self):
         """确保目录存在"""
@@ -105,20 +273,27 @@ class DataAnalyzer:
         加载数据
         
         Args:
-            filepath: 数据文件路径，如果为None则加载默认增强数据
+            filepath: 数据文件路径，如果为None则加载默认增强数据（优先Parquet，不存在时使用CSV）
             
         Returns:
             DataFrame
         """
         if filepath is None:
-            filepath = os.path.join(DATA_STORAGE['processed_data_dir'], 'enhanced_videos_data.csv')
+            filepath = os.path.join(DATA_STORAGE['processed_data_dir'], 'enhanced_videos_data.parquet')
+            if not os.path.exists(filepath):
+                # 兼容早期采集输出的CSV数据
+                filepath = os.path.join(DATA_STORAGE['processed_data_dir'], 'enhanced_videos_data.csv')
         
         try:
             if not os.path.exists(filepath):
                 self.logger.error(f"数据文件不存在: {filepath}")
                 return pd.DataFrame()
             
-            df = pd.read_csv(filepath, encoding='utf-8-sig')
+            if filepath.endswith('.parquet'):
+                # 采集阶段输出的Parquet已带列类型，直接读取
+                df = pd.read_parquet(filepath, engine='pyarrow')
+            else:
+                df = self._read_csv(filepath)
             self.logger.info(f"成功加载数据，共 {len(df)} 条记录")
             
             # 数据预处理
@@ -130,6 +305,35 @@ class DataAnalyzer:
             self.logger.error(f"加载数据失败: {e}")
             return pd.DataFrame()
     
+    def _read_csv(self, filepath: str) -> pd.DataFrame:
+        """
+        使用PyArrow多线程解析CSV（自动跳过UTF-8 BOM）
+        
+        简介等文本字段可能跨行，需允许引号内换行。数值列优先在解析时按int64读取；
+        若存在非整数单元格则按推断类型重新读取，由预处理中的 to_numeric 强制转换
+        
+        Args:
+            filepath: CSV文件路径
+            
+        Returns:
+            DataFrame
+        """
+        read_options = pacsv.ReadOptions(use_threads=True)
+        parse_options = pacsv.ParseOptions(newlines_in_values=True)
+        try:
+            table = pacsv.read_csv(
+                filepath,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(
+                    column_types={col: pa.int64() for col in self.NUMERIC_COLUMNS + ['pubdate']}
+                )
+            )
+        except pa.ArrowInvalid as e:
+            self.logger.warning(f"数值列包含非整数值，按推断类型重新读取: {e}")
+            table = pacsv.read_csv(filepath, read_options=read_options, parse_options=parse_options)
+        return table.to_pandas()
+    
     def _preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         数据预处理
@@ -143,37 +347,49 @@ class DataAnalyzer:
         # 转换时间戳为日期
         if 'pubdate' in df.columns:
             df['pubdate_datetime'] = pd.to_datetime(df['pubdate'], unit='s', errors='coerce')
-            df['year'] = df['pubdate_datetime'].dt.year
-            df['month'] = df['pubdate_datetime'].dt.month
-            df['quarter'] = df['pubdate_datetime'].dt.quarter
+            df['year'] = df['pubdate_datetime'].dt.year.astype('Int16')
+            df['month'] = df['pubdate_datetime'].dt.month.astype('Int8')
+            df['quarter'] = df['pubdate_datetime'].dt.quarter.astype('Int8')
         
-        # 处理数值类型
-        numeric_columns = ['view', 'danmaku', 'reply', 'favorite', 'coin', 'like', 'share']
-        for col in numeric_columns:
+        # 处理数值类型（按int64解析成功时已是数值列；否则强制转换，无法解析的单元格置0）
+        for col in self.NUMERIC_COLUMNS:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                if not pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[col] = df[col].fillna(0)
         
-        # 清理文本数据
+        # 清理文本数据（Arrow字符串连续存储，后续str操作走Arrow计算内核）
         text_columns = ['title', 'description', 'author', 'tag']
         for col in text_columns:
             if col in df.columns:
-                df[col] = df[col].astype(str).fillna('')
-        
-        # 计算参与度指标
-        df['engagement_score'] = (
-            df.get('like', 0) * 3 +
-            df.get('coin', 0) * 5 +
-            df.get('favorite', 0) * 4 +
-            df.get('share', 0) * 6 +
-            df.get('reply', 0) * 2
-        )
+                df[col] = df[col].fillna('').astype('string[pyarrow]')
+        
+        # 作者重复度高，字典编码后分组只需比较整数编码
+        if 'author' in df.columns:
+            df['author'] = df['author'].astype('category')
+        
+        # 计算参与度指标（已有指标列组成矩阵后与权重向量一次矩阵乘）
+        present = [col for col in self.ENGAGEMENT_WEIGHTS if col in df.columns]
+        weights = np.array([self.ENGAGEMENT_WEIGHTS[col] for col in present], dtype=np.float64)
+        engagement_score = df[present].to_numpy(dtype=np.float64) @ weights
         
         # 计算互动率
-        df['engagement_rate'] = np.where(
-            df.get('view', 0) > 0,
-            df['engagement_score'] / df['view'] * 100,
-            0
-        )
+        view = df['view'].to_numpy(dtype=np.float64)
+        engagement_rate = np.zeros_like(engagement_score)
+        np.divide(engagement_score * 100, view, out=engagement_rate, where=view > 0)
+        
+        df['engagement_score'] = engagement_score
+        df['engagement_rate'] = engagement_rate
+        
+        # 时间趋势分析所用的季度、月份整数键，如 20191 表示2019年第1季度，201901 表示2019年1月
+        if 'pubdate_datetime' in df.columns:
+            year = df['year'].astype('Int32')
+            df['year_quarter_key'] = year * 10 + df['quarter']
+            df['year_month_key'] = year * 100 + df['month']
+        
+        # 视频时长（分钟）
+        if 'duration_seconds' in df.columns:
+            df['duration_minutes'] = df['duration_seconds'] / 60
         
         self.logger.info("数据预处理完成")
         return df
@@ -192,36 +408,35 @@ class DataAnalyzer:
         
         results = {}
         
-        # 按年统计
-        yearly_stats = df.groupby('year').agg({
+        # 只保留聚合所需的列（季度、月份键在预处理时已生成）
+        sub = df[['year', 'year_quarter_key', 'year_month_key', 'bvid', 'view', 'engagement_score', 'engagement_rate']]
+        
+        agg_spec = {
             'bvid': 'count',
             'view': ['sum', 'mean'],
             'engagement_score': 'mean',
             'engagement_rate': 'mean'
-        }).round(2)
+        }
+        agg_columns = ['video_count', 'total_views', 'avg_views', 'avg_engagement_score', 'avg_engagement_rate']
+        
+        def group_stats(key: str) -> pd.DataFrame:
+            stats = sub.groupby(key, observed=True).agg(agg_spec).round(2)
+            stats.columns = agg_columns
+            return stats
         
-        yearly_stats.columns = ['video_count', 'total_views', 'avg_views', 'avg_engagement_score', 'avg_engagement_rate']
+        # 按年统计
+        yearly_stats = group_stats('year')
+        yearly_stats.index = yearly_stats.index.astype(str)
         results['yearly_trends'] = yearly_stats.to_dict('index')
         
         # 按季度统计
-        df['year_quarter'] = df['year'].astype(str) + '-Q' + df['quarter'].astype(str)
-        quarterly_stats = df.groupby('year_quarter').agg({
-            'bvid': 'count',
-            'view': 'mean',
-            'engagement_rate': 'mean'
-        }).round(2)
-        
-        quarterly_stats.columns = ['video_count', 'avg_views', 'avg_engagement_rate']
+        quarterly_stats = group_stats('year_quarter_key')[['video_count', 'avg_views', 'avg_engagement_rate']]
+        quarterly_stats.index = [f'{key // 10}-Q{key % 10}' for key in quarterly_stats.index]
         results['quarterly_trends'] = quarterly_stats.to_dict('index')
         
         # 按月统计
-        df['year_month'] = df['pubdate_datetime'].dt.to_period('M')
-        monthly_stats = df.groupby('year_month').agg({
-            'bvid': 'count',
-            'view': 'mean'
-        }).round(2)
-        
-        monthly_stats.columns = ['video_count', 'avg_views']
+        monthly_stats = group_stats('year_month_key')[['video_count', 'avg_views']]
+        monthly_stats.index = [f'{key // 100}-{key % 100:02d}' for key in monthly_stats.index]
         results['monthly_trends'] = monthly_stats.to_dict('index')
         
         self.logger.info("时间趋势分析完成")
@@ -241,47 +456,32 @@ class DataAnalyzer:
         
         results = {}
         
-        # 提取关键词
-        all_text = ' '.join(df['title'].fillna('') + ' ' + df['description'].fillna(''))
-        
-        # 使用jieba分词和关键词提取
-        keywords = jieba.analyse.extract_tags(all_text, topK=100, withWeight=True)
+        # 逐行分词一次，按年份累计词频
+        rows = self._tokenize_rows(df['title'].fillna('') + ' ' + df['description'].fillna(''))
+        yearly_counts = defaultdict(Counter)
+        for year, words in zip(df['year'].values, rows):
+            key = None if pd.isna(year) else int(year)
+            yearly_counts[key].update(self._keyword_tokens(words))
         
-        # 过滤停用词
-        filtered_keywords = [(word, weight) for word, weight in keywords 
-                           if word not in self.stopwords and len(word) > 1]
-        
-        results['top_keywords'] = filtered_keywords[:50]
+        # 全局关键词由各年词频汇总得到
+        all_counts = sum(yearly_counts.values(), Counter())
+        results['top_keywords'] = self._rank_keywords(all_counts, 50)
         
         # 按年分析关键词变化
         yearly_keywords = {}
-        for year in df['year'].unique():
-            if pd.isna(year):
+        for year, counts in yearly_counts.items():
+            if year is None or not counts:
                 continue
-            
-            year_data = df[df['year'] == year]
-            year_text = ' '.join(year_data['title'].fillna('') + ' ' + year_data['description'].fillna(''))
-            
-            if year_text.strip():
-                year_keywords = jieba.analyse.extract_tags(year_text, topK=20, withWeight=True)
-                filtered_year_keywords = [(word, weight) for word, weight in year_keywords 
-                                        if word not in self.stopwords and len(word) > 1]
-                yearly_keywords[int(year)] = filtered_year_keywords[:10]
+            yearly_keywords[str(year)] = self._rank_keywords(counts, 10)
         
         results['yearly_keywords'] = yearly_keywords
         
         # 分析标签
-        all_tags = []
-        for tags in df['tag'].fillna(''):
-            if tags:
-                tag_list = [tag.strip() for tag in str(tags).split(',')]
-                all_tags.extend(tag_list)
-        
-        tag_counter = Counter(all_tags)
-        results['top_tags'] = tag_counter.most_common(30)
+        tags = df['tag'].fillna('').str.split(',').explode().str.strip()
+        results['top_tags'] = list(tags[tags.str.len() > 0].value_counts().head(30).items())
         
         # 分析作者类型
-        author_stats = df.groupby('author').agg({
+        author_stats = df.groupby('author', observed=True, sort=False).agg({
             'bvid': 'count',
             'view': 'sum',
             'engagement_score': 'mean'
@@ -292,12 +492,37 @@ class DataAnalyzer:
         self.logger.info("内容主题分析完成")
         return results
     
-    def analyze_sentiment(self, df: pd.DataFrame) -> Dict:
+    def score_sentiment(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        计算标题情感分数并分类
+        
+        Args:
+            df: 数据DataFrame
+            
+        Returns:
+            与df索引对齐、包含 sentiment 和 sentiment_score 两列的DataFrame
+        """
+        title_tokens = self._tokenize_rows(df['title'].fillna(''))
+        sentiment_scores = self._score_titles(title_tokens)
+        
+        # 分类情感：低于消极阈值为0，高于积极阈值为2，其余为1
+        # 消极阈值本身属于中性，因此向下取相邻浮点数，使searchsorted的左侧语义与原判断一致
+        thresholds = ANALYSIS_CONFIG['sentiment_threshold']
+        bounds = np.array([np.nextafter(thresholds['negative'], -np.inf), thresholds['positive']])
+        codes = np.searchsorted(bounds, sentiment_scores)
+        sentiments = pd.Categorical.from_codes(codes, categories=['negative', 'neutral', 'positive'])
+        
+        return pd.DataFrame({'sentiment': sentiments, 'sentiment_score': sentiment_scores}, index=df.index)
+    
+    def analyze_sentiment(self, df: pd.DataFrame, scored: Optional[pd.DataFrame] = None) -> Dict:
         """
         分析情感态度
         
+        不修改df，便于与其他分析并行执行
+        
         Args:
             df: 数据DataFrame
+            scored: score_sentiment 的结果，为None时在此计算
             
         Returns:
             情感分析结果
@@ -307,64 +532,40 @@ class DataAnalyzer:
         results = {}
         
         # 对标题进行情感分析
-        sentiments = []
-        sentiment_scores = []
-        
-        for title in df['title'].fillna(''):
-            if title.strip():
-                try:
-                    # 使用SnowNLP进行中文情感分析
-                    s = SnowNLP(title)
-                    sentiment_score = s.sentiments
-                    sentiment_scores.append(sentiment_score)
-                    
-                    # 分类情感
-                    if sentiment_score > ANALYSIS_CONFIG['sentiment_threshold']['positive']:
-                        sentiments.append('positive')
-                    elif sentiment_score < ANALYSIS_CONFIG['sentiment_threshold']['negative']:
-                        sentiments.append('negative')
-                    else:
-                        sentiments.append('neutral')
-                except:
-                    sentiments.append('neutral')
-                    sentiment_scores.append(0.5)
-            else:
-                sentiments.append('neutral')
-                sentiment_scores.append(0.5)
-        
-        df['sentiment'] = sentiments
-        df['sentiment_score'] = sentiment_scores
+        if scored is None:
+            scored = self.score_sentiment(df)
+        data = pd.concat([df[['year', 'title', 'view', 'engagement_rate']], scored], axis=1)
         
         # 统计情感分布
-        sentiment_dist = df['sentiment'].value_counts()
+        sentiment_dist = data['sentiment'].value_counts()
+        sentiment_dist = sentiment_dist[sentiment_dist > 0]
         results['sentiment_distribution'] = sentiment_dist.to_dict()
         
         # 按年分析情感变化
-        yearly_sentiment = df.groupby(['year', 'sentiment']).size().unstack(fill_value=0)
+        yearly_sentiment = data.groupby(['year', 'sentiment'], observed=True).size().unstack(fill_value=0)
         yearly_sentiment_pct = yearly_sentiment.div(yearly_sentiment.sum(axis=1), axis=0) * 100
+        yearly_sentiment_pct.index = yearly_sentiment_pct.index.astype(str)
         results['yearly_sentiment'] = yearly_sentiment_pct.round(2).to_dict('index')
         
         # 情感与参与度关系
-        sentiment_engagement = df.groupby('sentiment').agg({
+        sentiment_engagement = data.groupby('sentiment', observed=True, sort=False).agg({
             'view': 'mean',
             'engagement_rate': 'mean',
             'sentiment_score': 'mean'
         }).round(3)
         results['sentiment_engagement'] = sentiment_engagement.to_dict('index')
         
-        # 积极/消极词汇分析
-        positive_titles = df[df['sentiment'] == 'positive']['title'].tolist()
-        negative_titles = df[df['sentiment'] == 'negative']['title'].tolist()
-        
-        if positive_titles:
-            positive_text = ' '.join(positive_titles)
-            positive_keywords = jieba.analyse.extract_tags(positive_text, topK=20)
-            results['positive_keywords'] = [kw for kw in positive_keywords if kw not in self.stopwords]
-        
-        if negative_titles:
-            negative_text = ' '.join(negative_titles)
-            negative_keywords = jieba.analyse.extract_tags(negative_text, topK=20)
-            results['negative_keywords'] = [kw for kw in negative_keywords if kw not in self.stopwords]
+        # 积极/消极词汇分析（逐条分词累计词频）
+        for sentiment in ('positive', 'negative'):
+            titles = data.loc[data['sentiment'] == sentiment, 'title']
+            if titles.empty:
+                continue
+            
+            counts = Counter(
+                word for words in self._tokenize_rows(titles.fillna(''))
+                for word in self._keyword_tokens(words)
+            )
+            results[f'{sentiment}_keywords'] = [word for word, _ in self._rank_keywords(counts, 20)]
         
         self.logger.info("情感态度分析完成")
         return results
@@ -413,11 +614,14 @@ class DataAnalyzer:
             'view': 'mean'
         }).round(2)
         
-        results['engagement_by_year'] = engagement_by_year.to_dict('index')
+        # 多级列展开为 {年份: {指标: {统计量: 值}}}，避免以元组作为键
+        results['engagement_by_year'] = {
+            str(year): {metric: row[metric].to_dict() for metric in ('engagement_rate', 'view')}
+            for year, row in engagement_by_year.iterrows()
+        }
         
         # 视频时长与参与度关系（如果有duration数据）
-        if 'duration_seconds' in df.columns:
-            df['duration_minutes'] = df['duration_seconds'] / 60
+        if 'duration_minutes' in df.columns:
             duration_bins = pd.cut(df['duration_minutes'], bins=[0, 5, 15, 30, 60, float('inf')], 
                                  labels=['0-5分钟', '5-15分钟', '15-30分钟', '30-60分钟', '60分钟以上'])
             
@@ -452,45 +656,31 @@ class DataAnalyzer:
                 'avg_views': round(df['view'].mean(), 2),
                 'total_engagement': int(df['engagement_score'].sum()),
                 'avg_engagement_rate': round(df['engagement_rate'].mean(), 3)
-            },
-            'time_trends': self.analyze_time_trends(df),
-            'content_themes': self.analyze_content_themes(df),
-            'sentiment_analysis': self.analyze_sentiment(df),
-            'engagement_patterns': self.analyze_engagement_patterns(df)
+            }
         }
         
-        # 处理数据以便JSON序列化
-        def convert_for_json(obj):
-            """转换对象为JSON可序列化格式"""
-            if hasattr(obj, 'to_dict'):
-                return obj.to_dict()
-            elif hasattr(obj, 'strftime'):  # 处理时间对象
-                return str(obj)
-            elif isinstance(obj, (pd.Period, pd.Timestamp)):
-                return str(obj)
-            elif isinstance(obj, tuple):
-                return list(obj)
-            elif isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            return str(obj)
-        
-        # 深度转换report
-        def deep_convert(data):
-            if isinstance(data, dict):
-                return {str(k): deep_convert(v) for k, v in data.items()}
-            elif isinstance(data, list):
-                return [deep_convert(item) for item in data]
-            else:
-                return convert_for_json(data)
-        
-        json_safe_report = deep_convert(report)
-        
-        # 保存报告
+        def sentiment_task():
+            scored = self.score_sentiment(df)
+            return scored, self.analyze_sentiment(df, scored)
+        
+        # 各项分析只读取df，可并行执行；情感列待全部完成后再写回
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'time_trends': executor.submit(self.analyze_time_trends, df),
+                'content_themes': executor.submit(self.analyze_content_themes, df),
+                'sentiment_analysis': executor.submit(sentiment_task),
+                'engagement_patterns': executor.submit(self.analyze_engagement_patterns, df)
+            }
+            report.update({key: future.result() for key, future in futures.items()})
+        
+        scored, report['sentiment_analysis'] = report['sentiment_analysis']
+        df['sentiment'] = scored['sentiment']
+        df['sentiment_score'] = scored['sentiment_score']
+        
+        # 保存报告（orjson直接输出UTF-8字节，原生支持numpy数值）
         report_file = os.path.join(DATA_STORAGE['output_dir'], 'analysis_report.json')
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(json_safe_report, f, ensure_ascii=False, indent=2)
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
         
         self.logger.info(f"综合报告已保存到: {report_file}")
         return report
@@ -505,24 +695,37 @@ class DataAnalyzer:
         # 保存CSV
         csv_file = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.csv')
         df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-        
-        # 保存Excel
-        excel_file = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.xlsx')
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='全部数据', index=False)
-            
-            # 按年分组
-            for year in sorted(df['year'].unique()):
-                if not pd.isna(year):
-                    year_data = df[df['year'] == year]
+        saved_files = [csv_file]
+        
+        # 保存Parquet（列式存储保留数据类型，重新加载远快于CSV/Excel）
+        parquet_file = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.parquet')
+        df.to_parquet(parquet_file, engine='pyarrow', compression='snappy', index=False)
+        saved_files.append(parquet_file)
+        
+        # 按年分区保存，按年份读取时只需加载对应分区
+        if 'year' in df.columns:
+            partitioned_dir = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data_by_year')
+            df.to_parquet(partitioned_dir, engine='pyarrow', compression='snappy', index=False,
+                          partition_cols=['year'], existing_data_behavior='delete_matching')
+            saved_files.append(partitioned_dir)
+        
+        # 保存Excel（openpyxl逐单元格写入较慢，可通过OUTPUT_CONFIG关闭）
+        if OUTPUT_CONFIG.get('excel_output', False):
+            excel_file = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.xlsx')
+            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+                df.to_excel(writer, sheet_name='全部数据', index=False)
+                
+                # 按年分组（groupby一次划分，缺失年份的记录不单独成表）
+                for year, year_data in df.groupby('year', sort=True, observed=True):
                     year_data.to_excel(writer, sheet_name=f'{int(year)}年数据', index=False)
+            saved_files.append(excel_file)
         
-        self.logger.info(f"处理后数据已保存到: {csv_file} 和 {excel_file}")
+        self.logger.info(f"处理后数据已保存到: {', '.join(saved_files)}")
 
 
 def main():
     """主函数"""
-    analyzer = ExecutionDataAnalyzer()
+    analyzer = DataAnalyzer()
     
     # 加载数据
     df = analyzer.load_data()
@@ -3,65 +3,237 @@ B站数据采集模块
 用于获取与执行力相关的视频和内容数据
 """
 
-import requests
-import json
+import orjson
 import time
+import hashlib
+import random
+import re
+import sqlite3
 import logging
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import os
+from pathlib import Path
 from urllib.parse import urlencode
 import asyncio
-import aiohttp
+from contextlib import asynccontextmanager
+import httpx
 from tqdm import tqdm
 
-from config import BILIBILI_SEARCH_API, SEARCH_KEYWORDS, DATE_RANGE, ANALYSIS_CONFIG, DATA_STORAGE
+from .config import BILIBILI_SEARCH_API, SEARCH_KEYWORDS, DATE_RANGE, ANALYSIS_CONFIG, DATA_STORAGE
+from .logging_setup import configure_logging
+
+
+# 关键词转为文件名时替换的字符
+FILENAME_TRANSLATION = str.maketrans({' ': '_', '/': '_'})
+
+# 搜索结果标题中的关键词高亮标签，兼容带属性的写法
+EM_TAG_PATTERN = re.compile(r'</?em(?:\s[^>]*)?>')
+
+# Parquet输出参数
+PARQUET_OPTIONS = {'engine': 'pyarrow', 'compression': 'zstd', 'index': False}
+
+# 触发退避重试的HTTP状态码
+RETRY_STATUSES = {429, 503}
+
+
+class AsyncTokenBucket:
+    """异步令牌桶限速器，允许突发 capacity 个请求，长期速率不超过 rate"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """取得一个令牌，令牌不足时等待补充"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
 
 
 class BilibiliDataCollector:
     """B站数据采集器"""
     
+    # 输出列名 -> (搜索结果字段, 缺失时默认值)
+    SEARCH_FIELDS = {
+        'bvid': ('bvid', ''),
+        'aid': ('aid', 0),
+        'title': ('title', ''),
+        'author': ('author', ''),
+        'mid': ('mid', 0),
+        'description': ('description', ''),
+        'duration': ('duration', ''),
+        'pubdate': ('pubdate', 0),
+        'created': ('created', 0),
+        'view': ('play', 0),
+        'danmaku': ('video_review', 0),
+        'reply': ('review', 0),
+        'favorite': ('favorites', 0),
+        'coin': ('coins', 0),
+        'like': ('like', 0),
+        'share': ('share', 0),
+        'tag': ('tag', ''),
+        'typeid': ('typeid', 0),
+        'typename': ('typename', ''),
+        'pic': ('pic', ''),
+        'arcurl': ('arcurl', ''),
+        'pts': ('pts', 0),
+        'arcrank': ('arcrank', ''),
+        'badgepay': ('badgepay', False)
+    }
+    
+    # 增强列名 -> (视频详情字段, 缺失时回退的原有列, 缺失时默认值)
+    DETAIL_FIELDS = {
+        'view': ('stat.view', 'view', None),
+        'danmaku': ('stat.danmaku', 'danmaku', None),
+        'reply': ('stat.reply', 'reply', None),
+        'favorite': ('stat.favorite', 'favorite', None),
+        'coin': ('stat.coin', 'coin', None),
+        'like': ('stat.like', 'like', None),
+        'share': ('stat.share', 'share', None),
+        'duration_seconds': ('duration', None, 0),
+        'cid': ('cid', None, 0),
+        'pages': ('pages', None, 1),
+        'owner_name': ('owner.name', 'author', None),
+        'owner_mid': ('owner.mid', 'mid', None),
+        'owner_face': ('owner.face', None, ''),
+        'tname': ('tname', 'typename', None),
+        'copyright': ('copyright', None, 0),
+        'desc': ('desc', 'description', None),
+        'dynamic': ('dynamic', None, ''),
+        'subtitle': ('subtitle', None, {}),
+        'staff': ('staff', None, []),
+        'argue_info': ('argue_info', None, {}),
+        'honor_reply': ('honor_reply', None, {})
+    }
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(BILIBILI_SEARCH_API['headers'])
-        self.logger = self._setup_logger()
+        self._client = None
+        self._semaphore = None
+        self._limiter = None
+        configure_logging()
+        self.logger = logging.getLogger('BilibiliDataCollector')
+        self.raw_dir = Path(DATA_STORAGE['raw_data_dir'])
+        self.processed_dir = Path(DATA_STORAGE['processed_data_dir'])
+        self.cache_dir = Path(DATA_STORAGE['cache_dir'])
         self._ensure_directories()
+        self._cache = self._open_cache()
+    
+    def _open_cache(self) -> sqlite3.Connection:
+        """打开接口响应的磁盘缓存"""
+        cache = sqlite3.connect(self.cache_dir / 'http_cache.sqlite3')
+        cache.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(key TEXT PRIMARY KEY, data BLOB NOT NULL, created REAL NOT NULL)'
+        )
+        cache.commit()
+        return cache
+    
+    def clear_cache(self):
+        """清空接口响应缓存"""
+        self._cache.execute('DELETE FROM responses')
+        self._cache.commit()
+        self.logger.info("已清空接口响应缓存")
+    
+    @asynccontextmanager
+    async def _open_client(self):
+        """打开共享的HTTP会话，并创建限制并发请求数的信号量和限速器"""
+        self._semaphore = asyncio.Semaphore(ANALYSIS_CONFIG['concurrency'])
+        self._limiter = AsyncTokenBucket(ANALYSIS_CONFIG['rate_per_sec'], ANALYSIS_CONFIG['concurrency'])
+        # HTTP/2 在同一连接上多路复用并发请求，服务端不支持时自动回退到 HTTP/1.1
+        limits = httpx.Limits(max_connections=ANALYSIS_CONFIG['connection_pool_size'],
+                              max_keepalive_connections=ANALYSIS_CONFIG['connection_pool_size'])
         
-    def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger('BilibiliDataCollector')
-        logger.setLevel(logging.INFO)
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=BILIBILI_SEARCH_API['headers'],
+                                     timeout=10.0) as client:
+            self._client = client
+            try:
+                yield client
+            finally:
+                self._client = None
+                # 缓存写入在会话结束时统一提交
+                self._cache.commit()
+    
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        """
+        在限速和并发限制下发送GET请求并解析JSON
+        
+        遇到429/503、连接错误或超时时按带抖动的指数退避重试，最多重试 max_retries 次。
         
-        if not logger.handlers:
-            # 创建文件处理器
-            log_file = os.path.join(DATA_STORAGE['logs_dir'], 'collector.log')
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
+        Args:
+            url: 请求地址
+            params: 查询参数
             
-            # 创建控制台处理器
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
+        Returns:
+            响应JSON
+        """
+        key = hashlib.blake2b(url.encode() + orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        min_created = time.time() - ANALYSIS_CONFIG['cache_expire']
+        cached = self._cache.execute(
+            'SELECT data FROM responses WHERE key = ? AND created >= ?', (key, min_created)
+        ).fetchone()
+        if cached is not None:
+            return orjson.loads(cached[0])
+        
+        max_retries = ANALYSIS_CONFIG['max_retries']
+        
+        for attempt in range(max_retries + 1):
+            try:
+                async with self._limiter, self._semaphore:
+                    response = await self._client.get(url, params=params)
+                    response.raise_for_status()
+                    body = response.content
+                break
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                    raise
+                reason = f"HTTP {e.response.status_code}"
+            except httpx.TransportError as e:
+                if attempt == max_retries:
+                    raise
+                reason = repr(e)
             
-            # 创建格式器
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            # 退避等待不占用信号量，其他请求可继续进行
+            backoff = random.uniform(0, min(ANALYSIS_CONFIG['max_backoff'], 2 ** attempt))
+            self.logger.warning(f"请求失败（{reason}），{backoff:.1f}秒后第{attempt + 1}次重试: {url}")
+            await asyncio.sleep(backoff)
+        
+        data = orjson.loads(body)
+        # 只缓存成功的响应，错误响应下次重新请求
+        if isinstance(data, dict) and data.get('code') == 0:
+            self._cache.execute(
+                'INSERT OR REPLACE INTO responses (key, data, created) VALUES (?, ?, ?)',
+                (key, body, time.time())
             )
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-            
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
-            
-        return logger
+        return data
     
     def _ensure_directories(self):
         """确保目录存在"""
         for dir_path in DATA_STORAGE.values():
             os.makedirs(dir_path, exist_ok=True)
     
-    def search_videos(self, keyword: str, page: int = 1, 
-                     order: str = 'totalrank') -> Dict:
+    async def search_videos(self, keyword: str, page: int = 1, 
+                           order: str = 'totalrank') -> Dict:
         """
         搜索视频
         
@@ -84,37 +256,34 @@ class BilibiliDataCollector:
         
         try:
             url = BILIBILI_SEARCH_API['search_type_url']
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            data = await self._get_json(url, params)
             
-            data = response.json()
             if data.get('code') == 0:
                 # 新API格式的数据结构
-                result_data = data.get('data', {})
-                if 'result' in result_data:
-                    # 查找视频结果
-                    for item in result_data['result']:
-                        if item.get('result_type') == 'video':
-                            return {'result': item.get('data', [])}
-                    
-                    # 如果没有找到video类型，返回第一个结果
-                    if result_data['result']:
-                        first_result = result_data['result'][0]
-                        return {'result': first_result.get('data', [])}
+                results = (data.get('data') or {}).get('result') or []
+                
+                # 查找视频结果
+                for item in results:
+                    if item.get('result_type') == 'video':
+                        return {'result': item.get('data', [])}
+                
+                # 如果没有找到video类型，返回第一个结果
+                if results:
+                    return {'result': results[0].get('data', [])}
                 
                 return {'result': []}
             else:
                 self.logger.error(f"API返回错误: {data.get('message', '未知错误')}")
                 return {}
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"搜索请求失败: {e}")
             return {}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"JSON解析失败: {e}")
             return {}
     
-    def get_video_info(self, bvid: str) -> Dict:
+    async def get_video_info(self, bvid: str) -> Dict:
         """
         获取视频详细信息
         
@@ -128,162 +297,245 @@ class BilibiliDataCollector:
         
         try:
             url = BILIBILI_SEARCH_API['video_info_url']
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            data = await self._get_json(url, params)
             
-            data = response.json()
             if data.get('code') == 0:
-                return data.get('data', {})
+                return data.get('data') or {}
             else:
                 self.logger.warning(f"获取视频信息失败 {bvid}: {data.get('message', '未知错误')}")
                 return {}
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"获取视频信息请求失败 {bvid}: {e}")
             return {}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"视频信息JSON解析失败 {bvid}: {e}")
             return {}
     
-    def extract_video_data(self, video_item: Dict) -> Dict:
+    def extract_video_data(self, videos: List[Dict],
+                           collected_at: Optional[List[int]] = None) -> pd.DataFrame:
         """
-        从搜索结果中提取视频数据
+        从搜索结果中批量提取视频数据
         
         Args:
-            video_item: 视频项目数据
+            videos: 搜索结果中的视频项目列表
+            collected_at: 与 videos 逐条对应的采集时间戳，提供时写入 collected_at 列
             
         Returns:
-            提取的视频数据字典
+            提取的视频数据DataFrame，列与 SEARCH_FIELDS 一致，提取失败时为空
         """
         try:
+            page = pd.json_normalize(videos)
+            
+            # 提取作者信息，缺失时依次回退到 owner.name 和 owner
+            author = page['author'] if 'author' in page else pd.Series(None, index=page.index, dtype=object)
+            for owner_column in ('owner.name', 'owner'):
+                if owner_column in page:
+                    author = author.fillna(page[owner_column].dropna().astype(str))
+            page['author'] = author
+            
+            # 按字段表重命名并补齐缺失列
+            sources = [source for source, _ in self.SEARCH_FIELDS.values()]
+            frame = page.reindex(columns=sources)
+            frame.columns = list(self.SEARCH_FIELDS)
+            frame = frame.fillna({column: default for column, (_, default) in self.SEARCH_FIELDS.items()})
+            
+            integer_columns = [column for column, (_, default) in self.SEARCH_FIELDS.items()
+                               if isinstance(default, int) and not isinstance(default, bool)]
+            frame[integer_columns] = (frame[integer_columns]
+                                      .apply(pd.to_numeric, errors='coerce')
+                                      .fillna(0)
+                                      .astype('int64'))
+            
+            # 文本列使用Arrow字符串，内存连续且 str 方法走Arrow计算内核
+            string_columns = [column for column, (_, default) in self.SEARCH_FIELDS.items() if default == '']
+            frame[string_columns] = frame[string_columns].astype('string[pyarrow]')
+            
             # 清理标题中的HTML标签
-            title = video_item.get('title', '')
-            title = title.replace('<em class="keyword">', '').replace('</em>', '')
-            
-            # 提取作者信息
-            author = ''
-            if 'author' in video_item:
-                author = video_item['author']
-            elif 'owner' in video_item:
-                owner = video_item['owner']
-                if isinstance(owner, dict):
-                    author = owner.get('name', '')
-                else:
-                    author = str(owner)
-            
-            return {
-                'bvid': video_item.get('bvid', ''),
-                'aid': video_item.get('aid', 0),
-                'title': title,
-                'author': author,
-                'mid': video_item.get('mid', 0),
-                'description': video_item.get('description', ''),
-                'duration': video_item.get('duration', ''),
-                'pubdate': video_item.get('pubdate', 0),
-                'created': video_item.get('created', 0),
-                'view': video_item.get('play', 0),
-                'danmaku': video_item.get('video_review', 0),
-                'reply': video_item.get('review', 0),
-                'favorite': video_item.get('favorites', 0),
-                'coin': video_item.get('coins', 0),
-                'like': video_item.get('like', 0),
-                'share': video_item.get('share', 0),
-                'tag': video_item.get('tag', ''),
-                'typeid': video_item.get('typeid', 0),
-                'typename': video_item.get('typename', ''),
-                'pic': video_item.get('pic', ''),
-                'arcurl': video_item.get('arcurl', ''),
-                'pts': video_item.get('pts', 0),
-                'arcrank': video_item.get('arcrank', ''),
-                'badgepay': video_item.get('badgepay', False)
-            }
+            frame['title'] = frame['title'].str.replace(EM_TAG_PATTERN, '', regex=True)
+            
+            if collected_at is not None:
+                frame['collected_at'] = np.asarray(collected_at, dtype=np.int64)
+            
+            return frame
         except Exception as e:
             self.logger.error(f"提取视频数据失败: {e}")
-            return {}
+            return pd.DataFrame(columns=list(self.SEARCH_FIELDS))
     
-    def filter_by_date(self, videos: List[Dict], 
-                      start_timestamp: int, end_timestamp: int) -> List[Dict]:
+    def filter_by_date(self, videos: pd.DataFrame, 
+                      start_timestamp: int, end_timestamp: int) -> pd.DataFrame:
         """
         按时间范围过滤视频
         
         Args:
-            videos: 视频列表
+            videos: 视频数据DataFrame
             start_timestamp: 开始时间戳
             end_timestamp: 结束时间戳
             
         Returns:
-            过滤后的视频列表
+            过滤后的视频数据DataFrame
         """
-        filtered_videos = []
-        for video in videos:
-            pubdate = video.get('pubdate', 0)
-            created = video.get('created', 0)
-            
-            # 使用发布时间或创建时间
-            timestamp = pubdate if pubdate > 0 else created
+        if videos.empty:
+            return videos
+        
+        # 使用发布时间或创建时间
+        timestamp = videos['pubdate'].where(videos['pubdate'] > 0, videos['created'])
+        
+        return videos[timestamp.between(start_timestamp, end_timestamp)].reset_index(drop=True)
+    
+    def _to_arrow_compatible(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        转换为可写入Parquet的副本
+        
+        Args:
+            df: 原始DataFrame
             
-            if start_timestamp <= timestamp <= end_timestamp:
-                filtered_videos.append(video)
-                
-        return filtered_videos
+        Returns:
+            嵌套结构与混合类型列已转为字符串的DataFrame副本
+        """
+        df = df.copy()
+        
+        for column in df.columns[df.dtypes == object]:
+            values = df[column]
+            if values.map(lambda v: isinstance(v, (dict, list))).any():
+                # 嵌套结构（subtitle、staff 等）序列化为JSON字符串
+                df[column] = values.map(lambda v: orjson.dumps(v).decode())
+            elif pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+                # 类型不一致的列统一为字符串，保证Arrow可写
+                df[column] = values.where(values.isna(), values.astype(str))
+        
+        return df
     
-    def collect_keyword_data(self, keyword: str, max_pages: int = 20) -> List[Dict]:
+    def save_parquet(self, df: pd.DataFrame, filepath: str):
         """
-        收集单个关键词的数据
+        以zstd压缩的Parquet格式保存数据
+        
+        Args:
+            df: 待保存的DataFrame
+            filepath: 保存路径
+        """
+        self._to_arrow_compatible(df).to_parquet(filepath, **PARQUET_OPTIONS)
+    
+    async def _fetch_keyword_pages(self, keyword: str, max_pages: int = 20,
+                                   pbar: Optional[tqdm] = None) -> List[Tuple[int, List[Dict]]]:
+        """
+        请求单个关键词的搜索结果页
         
         Args:
             keyword: 搜索关键词
             max_pages: 最大页数
+            pbar: 共享的进度条
             
         Returns:
-            视频数据列表
+            按页码顺序的 (采集时间戳, 视频项目列表) 列表，同一关键词内重复的视频只保留首次出现
         """
         self.logger.info(f"开始收集关键词 '{keyword}' 的数据")
         
-        all_videos = []
-        page = 1
+        fetched_pages = []
+        seen_bvids = set()
+        collected = 0
+        previous_page_hash = None
+        window = ANALYSIS_CONFIG['concurrency']
         
-        with tqdm(desc=f"收集 {keyword}", unit="页") as pbar:
-            while page <= max_pages:
-                try:
-                    # 搜索视频
-                    search_result = self.search_videos(keyword, page)
-                    
-                    if not search_result or 'result' not in search_result:
-                        self.logger.warning(f"第{page}页搜索结果为空，停止收集")
-                        break
-                    
-                    videos = search_result.get('result', [])
-                    if not videos:
-                        self.logger.info(f"第{page}页无更多结果，收集完成")
-                        break
-                    
-                    # 提取视频数据
-                    for video_item in videos:
-                        video_data = self.extract_video_data(video_item)
-                        if video_data:
-                            video_data['search_keyword'] = keyword
-                            video_data['collected_at'] = int(time.time())
-                            all_videos.append(video_data)
-                    
-                    page += 1
+        # 按窗口并发请求多页，窗口内结果按页码顺序处理，遇到空页即停止
+        for start in range(1, max_pages + 1, window):
+            pages = range(start, min(start + window, max_pages + 1))
+            results = await asyncio.gather(
+                *(self.search_videos(keyword, page) for page in pages),
+                return_exceptions=True
+            )
+            
+            finished = False
+            for page, search_result in zip(pages, results):
+                if isinstance(search_result, Exception):
+                    self.logger.error(f"收集 '{keyword}' 第{page}页数据时出错: {search_result}")
+                    finished = True
+                    break
+                
+                if not search_result or 'result' not in search_result:
+                    self.logger.warning(f"'{keyword}' 第{page}页搜索结果为空，停止收集")
+                    finished = True
+                    break
+                
+                videos = search_result.get('result', [])
+                if not videos:
+                    self.logger.info(f"'{keyword}' 第{page}页无更多结果，收集完成")
+                    finished = True
+                    break
+                
+                # 超出实际结果数后接口会重复返回最后一页
+                page_hash = hash(tuple(video_item.get('bvid', '') for video_item in videos))
+                if page_hash == previous_page_hash:
+                    self.logger.info(f"'{keyword}' 第{page}页与上一页相同，收集完成")
+                    finished = True
+                    break
+                previous_page_hash = page_hash
+                
+                # 跳过本关键词前面页已收集过的视频
+                page_items = []
+                for video_item in videos:
+                    bvid = video_item.get('bvid', '')
+                    if bvid not in seen_bvids:
+                        seen_bvids.add(bvid)
+                        page_items.append(video_item)
+                fetched_pages.append((int(time.time()), page_items))
+                collected += len(videos)
+                
+                if pbar is not None:
                     pbar.update(1)
-                    
-                    # 请求间隔
-                    time.sleep(ANALYSIS_CONFIG['request_delay'])
-                    
-                    # 检查是否达到最大结果数
-                    if len(all_videos) >= ANALYSIS_CONFIG['max_results_per_keyword']:
-                        self.logger.info(f"达到最大结果数限制，停止收集")
-                        break
-                        
-                except Exception as e:
-                    self.logger.error(f"收集第{page}页数据时出错: {e}")
+                
+                # 检查是否达到最大结果数
+                if collected >= ANALYSIS_CONFIG['max_results_per_keyword']:
+                    self.logger.info(f"'{keyword}' 达到最大结果数限制，停止收集")
+                    finished = True
                     break
+            
+            if finished:
+                break
+        
+        return fetched_pages
+    
+    def _build_keyword_frame(self, keyword: str, fetched_pages: List[Tuple[int, List[Dict]]]) -> pd.DataFrame:
+        """
+        将单个关键词的搜索结果页一次性提取为DataFrame并按时间过滤
+        
+        Args:
+            keyword: 搜索关键词
+            fetched_pages: _fetch_keyword_pages 的结果
+            
+        Returns:
+            视频数据DataFrame
+        """
+        # 原始结果与采集时间按列展开，记录页边界以便提取失败时逐页重试
+        video_items = []
+        collected_at = []
+        page_bounds = [0]
+        for page_time, page_items in fetched_pages:
+            video_items.extend(page_items)
+            collected_at.extend([page_time] * len(page_items))
+            page_bounds.append(len(video_items))
+        
+        if not video_items:
+            self.logger.info(f"关键词 '{keyword}' 收集完成，共 0 个有效视频")
+            return pd.DataFrame()
+        
+        # 提取视频数据；整批失败时逐页重新提取，只丢弃出错的页
+        videos_df = self.extract_video_data(video_items, collected_at)
+        if videos_df.empty:
+            page_frames = [
+                self.extract_video_data(video_items[begin:end], collected_at[begin:end])
+                for begin, end in zip(page_bounds, page_bounds[1:]) if end > begin
+            ]
+            page_frames = [frame for frame in page_frames if not frame.empty]
+            if not page_frames:
+                self.logger.info(f"关键词 '{keyword}' 收集完成，共 0 个有效视频")
+                return pd.DataFrame()
+            videos_df = pd.concat(page_frames, ignore_index=True)
+        videos_df['search_keyword'] = keyword
         
         # 按时间过滤
         filtered_videos = self.filter_by_date(
-            all_videos, 
+            videos_df, 
             DATE_RANGE['start_timestamp'], 
             DATE_RANGE['end_timestamp']
         )
@@ -291,6 +543,101 @@ class BilibiliDataCollector:
         self.logger.info(f"关键词 '{keyword}' 收集完成，共 {len(filtered_videos)} 个有效视频")
         return filtered_videos
     
+    async def collect_keyword_data(self, keyword: str, max_pages: int = 20,
+                                   pbar: Optional[tqdm] = None) -> pd.DataFrame:
+        """
+        收集单个关键词的数据
+        
+        Args:
+            keyword: 搜索关键词
+            max_pages: 最大页数
+            pbar: 共享的进度条
+            
+        Returns:
+            视频数据DataFrame
+        """
+        fetched_pages = await self._fetch_keyword_pages(keyword, max_pages, pbar)
+        return self._build_keyword_frame(keyword, fetched_pages)
+    
+    async def _collect_keywords(self, keywords: List[str]) -> List:
+        """
+        并发请求多个关键词的搜索结果页
+        
+        Args:
+            keywords: 关键词列表
+            
+        Returns:
+            与关键词一一对应的 _fetch_keyword_pages 结果列表，失败的关键词对应异常对象
+        """
+        async with self._open_client():
+            with tqdm(desc="收集数据", unit="页") as pbar:
+                return await asyncio.gather(
+                    *(self._fetch_keyword_pages(keyword, pbar=pbar) for keyword in keywords),
+                    return_exceptions=True
+                )
+    
+    @staticmethod
+    def _assign_keyword_owners(keyword_pages: List) -> List:
+        """
+        确定跨关键词重复视频的归属
+        
+        并发请求下各关键词完成的先后不确定，因此在全部请求结束后按关键词顺序统一处理：
+        同一视频归属列表中靠后的关键词（与按bvid去重 keep='last' 一致），结果不随网络时序变化
+        
+        Args:
+            keyword_pages: 与关键词顺序一致的 _fetch_keyword_pages 结果，失败的关键词为异常对象
+            
+        Returns:
+            去除已归属其他关键词的视频后的结果列表，异常对象原样保留
+        """
+        claimed = set()
+        owned = [None] * len(keyword_pages)
+        for index in range(len(keyword_pages) - 1, -1, -1):
+            fetched_pages = keyword_pages[index]
+            if isinstance(fetched_pages, Exception):
+                owned[index] = fetched_pages
+                continue
+            
+            kept_pages = []
+            for page_time, page_items in fetched_pages:
+                kept_items = [item for item in page_items if item.get('bvid', '') not in claimed]
+                kept_pages.append((page_time, kept_items))
+            claimed.update(item.get('bvid', '') for _, page_items in fetched_pages for item in page_items)
+            owned[index] = kept_pages
+        return owned
+    
+    async def _fetch_video_infos(self, bvids: List[str]) -> Dict[str, Dict]:
+        """
+        分批并发获取视频详细信息
+        
+        Args:
+            bvids: 视频BV号列表
+            
+        Returns:
+            BV号到视频信息的映射，获取失败的视频不在其中
+        """
+        video_infos = {}
+        batch_size = ANALYSIS_CONFIG['batch_size']
+        
+        async with self._open_client():
+            with tqdm(total=len(bvids), desc="增强数据") as pbar:
+                for start in range(0, len(bvids), batch_size):
+                    batch = bvids[start:start + batch_size]
+                    results = await asyncio.gather(
+                        *(self.get_video_info(bvid) for bvid in batch),
+                        return_exceptions=True
+                    )
+                    
+                    for bvid, video_info in zip(batch, results):
+                        if isinstance(video_info, Exception):
+                            self.logger.error(f"增强数据时出错 (bvid: {bvid}): {video_info}")
+                        elif video_info:
+                            video_infos[bvid] = video_info
+                    
+                    pbar.update(len(batch))
+        
+        return video_infos
+    
     def collect_all_data(self) -> pd.DataFrame:
         """
         收集所有关键词的数据
@@ -301,36 +648,38 @@ class BilibiliDataCollector:
         self.logger.info("开始收集所有关键词数据")
         
         all_data = []
+        keyword_pages = self._assign_keyword_owners(asyncio.run(self._collect_keywords(SEARCH_KEYWORDS)))
         
-        for keyword in SEARCH_KEYWORDS:
-            try:
-                keyword_data = self.collect_keyword_data(keyword)
-                all_data.extend(keyword_data)
-                
-                # 保存单个关键词的数据
-                if keyword_data:
-                    keyword_df = pd.DataFrame(keyword_data)
-                    filename = f"{keyword.replace(' ', '_')}_data.csv"
-                    filepath = os.path.join(DATA_STORAGE['raw_data_dir'], filename)
-                    keyword_df.to_csv(filepath, index=False, encoding='utf-8-sig')
-                    self.logger.info(f"已保存关键词 '{keyword}' 数据到 {filepath}")
-                
-            except Exception as e:
-                self.logger.error(f"收集关键词 '{keyword}' 数据时出错: {e}")
+        for keyword, fetched_pages in zip(SEARCH_KEYWORDS, keyword_pages):
+            if isinstance(fetched_pages, Exception):
+                self.logger.error(f"收集关键词 '{keyword}' 数据时出错: {fetched_pages}")
                 continue
+            
+            keyword_data = self._build_keyword_frame(keyword, fetched_pages)
+            if not keyword_data.empty:
+                all_data.append(keyword_data)
         
         if all_data:
-            # 创建DataFrame并去重
-            df = pd.DataFrame(all_data)
+            # 各关键词收集时已按bvid去重，直接合并
+            df = pd.concat(all_data, ignore_index=True)
             
-            # 按bvid去重，保留最新的记录
-            df = df.drop_duplicates(subset=['bvid'], keep='last')
+            # 只做一次Parquet兼容转换，完整数据与各关键词数据共用
+            prepared = self._to_arrow_compatible(df)
             
             # 保存完整数据
-            filepath = os.path.join(DATA_STORAGE['raw_data_dir'], 'all_videos_data.csv')
-            df.to_csv(filepath, index=False, encoding='utf-8-sig')
+            filepath = self.raw_dir / 'all_videos_data.parquet'
+            prepared.to_parquet(filepath, **PARQUET_OPTIONS)
             self.logger.info(f"已保存完整数据到 {filepath}")
             
+            # 保存单个关键词的数据
+            for keyword, keyword_data in prepared.groupby('search_keyword', sort=False):
+                try:
+                    filepath = self.raw_dir / f"{keyword.translate(FILENAME_TRANSLATION)}_data.parquet"
+                    keyword_data.to_parquet(filepath, **PARQUET_OPTIONS)
+                    self.logger.info(f"已保存关键词 '{keyword}' 数据到 {filepath}")
+                except Exception as e:
+                    self.logger.error(f"保存关键词 '{keyword}' 数据时出错: {e}")
+            
             self.logger.info(f"数据收集完成，共收集 {len(df)} 个唯一视频")
             return df
         else:
@@ -349,62 +698,46 @@ class BilibiliDataCollector:
         """
         self.logger.info("开始增强视频数据")
         
-        enhanced_data = []
+        enhanced_df = df[df['bvid'].notna() & (df['bvid'] != '')].reset_index(drop=True)
+        bvids = list(enhanced_df['bvid'].unique())
+        video_infos = asyncio.run(self._fetch_video_infos(bvids))
         
-        for idx, row in tqdm(df.iterrows(), total=len(df), desc="增强数据"):
-            try:
-                bvid = row['bvid']
-                if not bvid:
-                    continue
-                
-                # 获取详细视频信息
-                video_info = self.get_video_info(bvid)
-                
-                if video_info:
-                    # 合并数据
-                    enhanced_row = row.to_dict()
-                    
-                    # 更新更详细的信息
-                    enhanced_row.update({
-                        'view': video_info.get('stat', {}).get('view', row['view']),
-                        'danmaku': video_info.get('stat', {}).get('danmaku', row['danmaku']),
-                        'reply': video_info.get('stat', {}).get('reply', row['reply']),
-                        'favorite': video_info.get('stat', {}).get('favorite', row['favorite']),
-                        'coin': video_info.get('stat', {}).get('coin', row['coin']),
-                        'like': video_info.get('stat', {}).get('like', row['like']),
-                        'share': video_info.get('stat', {}).get('share', row['share']),
-                        'duration_seconds': video_info.get('duration', 0),
-                        'cid': video_info.get('cid', 0),
-                        'pages': video_info.get('pages', 1),
-                        'owner_name': video_info.get('owner', {}).get('name', row['author']),
-                        'owner_mid': video_info.get('owner', {}).get('mid', row['mid']),
-                        'owner_face': video_info.get('owner', {}).get('face', ''),
-                        'tname': video_info.get('tname', row['typename']),
-                        'copyright': video_info.get('copyright', 0),
-                        'desc': video_info.get('desc', row['description']),
-                        'dynamic': video_info.get('dynamic', ''),
-                        'subtitle': video_info.get('subtitle', {}),
-                        'staff': video_info.get('staff', []),
-                        'argue_info': video_info.get('argue_info', {}),
-                        'honor_reply': video_info.get('honor_reply', {})
-                    })
-                    
-                    enhanced_data.append(enhanced_row)
-                else:
-                    enhanced_data.append(row.to_dict())
-                
-                # 请求间隔
-                time.sleep(ANALYSIS_CONFIG['request_delay'])
-                
-            except Exception as e:
-                self.logger.error(f"增强数据时出错 (bvid: {row.get('bvid', 'unknown')}): {e}")
-                enhanced_data.append(row.to_dict())
+        # 展开详细信息一层（stat.view、owner.name 等），并按行对齐到原数据
+        details = pd.json_normalize(list(video_infos.values()), max_level=1)
+        details.index = pd.Index(list(video_infos), dtype=object)
+        details = details.reindex(enhanced_df['bvid'].to_numpy())
+        details.index = enhanced_df.index
+        matched = enhanced_df['bvid'].isin(video_infos)
+        
+        for column, (source, fallback, default) in self.DETAIL_FIELDS.items():
+            if isinstance(default, (dict, list)):
+                # 嵌套结构保持原样，不展开
+                nested = pd.Series({bvid: info.get(source, default) for bvid, info in video_infos.items()},
+                                   dtype=object)
+                values = enhanced_df['bvid'].map(nested)
+            else:
+                values = details[source] if source in details else pd.Series(None, index=details.index, dtype=object)
+                values = values.fillna(enhanced_df[fallback] if fallback else default)
+            
+            # 未获取到详细信息的行保留原值并沿用原列类型，新增列留空
+            if column in enhanced_df:
+                original = enhanced_df[column]
+                enhanced_df[column] = values.where(matched, original).astype(original.dtype)
+            else:
+                values = values.where(matched)
+                # 详情中的整数字段（owner_mid、cid、copyright等）因缺失值被提升为float64，
+                # 转为可空整数，避免ID以科学计数法写出
+                if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                    values = values.astype('Int64')
+                enhanced_df[column] = values
         
-        enhanced_df = pd.DataFrame(enhanced_data)
+        # 分区名称重复度高，转为分类类型节省内存
+        for column in ('typename', 'tname'):
+            enhanced_df[column] = enhanced_df[column].astype('category')
         
         # 保存增强后的数据
-        filepath = os.path.join(DATA_STORAGE['processed_data_dir'], 'enhanced_videos_data.csv')
-        enhanced_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        filepath = self.processed_dir / 'enhanced_videos_data.parquet'
+        self.save_parquet(enhanced_df, filepath)
         self.logger.info(f"已保存增强数据到 {filepath}")
         
         return enhanced_df
@@ -3,45 +3,48 @@
 处理matplotlib中文字体显示问题
 """
 
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.font_manager as fm
 import logging
+import re
+from functools import lru_cache
 
 
+# 中文字体优先级，Hiragino Sans GB 为首选
+PREFERRED_CHINESE_FONTS = ['Hiragino Sans GB', 'PingFang SC', 'Arial Unicode MS', 'STHeiti', 'SimHei', 'Microsoft YaHei']
+
+# 常见中文字体关键词
+CHINESE_FONT_PATTERN = re.compile('|'.join(map(re.escape, [
+    'Chinese', 'CJK', 'Han', 'Hei', 'Song', 'Kai', 'Fang',
+    'PingFang', 'Hiragino', 'STHeiti', 'SimHei', 'Microsoft YaHei',
+    'WenQuanYi', 'Noto', 'Source'
+])))
+
+
+@lru_cache(maxsize=1)
 def setup_chinese_font():
     """
     设置matplotlib的中文字体
     
+    只在首次调用时扫描已注册的字体，之后直接返回缓存的结果。
+    
     Returns:
         str: 使用的字体名称，如果没有找到中文字体则返回None
     """
-    # 清除matplotlib字体缓存
-    try:
-        import shutil
-        import os
-        cache_dir = fm.get_cachedir()
-        if os.path.exists(cache_dir):
-            shutil.rmtree(cache_dir)
-        fm._rebuild()
-    except:
-        pass
-    
-    # 强制设置Hiragino Sans GB为首选字体
-    plt.rcParams['font.sans-serif'] = ['Hiragino Sans GB', 'PingFang SC', 'Arial Unicode MS', 'STHeiti', 'SimHei', 'Microsoft YaHei']
-    plt.rcParams['font.family'] = 'sans-serif'
-    plt.rcParams['axes.unicode_minus'] = False
-    
-    # 验证字体设置
-    try:
-        # 创建一个简单的测试
-        import matplotlib.font_manager as fm
-        font_prop = fm.FontProperties(family='sans-serif')
-        actual_font = font_prop.get_name()
-        logging.info(f"实际使用的字体: {actual_font}")
-    except Exception as e:
-        logging.warning(f"字体验证失败: {e}")
+    installed = {f.name for f in fm.fontManager.ttflist}
+    font_name = next((name for name in PREFERRED_CHINESE_FONTS if name in installed), None)
     
-    return 'Hiragino Sans GB'
+    # 找到的字体放在首位，其余候选字体作为后备
+    if font_name:
+        matplotlib.rcParams['font.sans-serif'] = [font_name] + [name for name in PREFERRED_CHINESE_FONTS if name != font_name]
+        logging.info(f"实际使用的字体: {font_name}")
+    else:
+        matplotlib.rcParams['font.sans-serif'] = list(PREFERRED_CHINESE_FONTS)
+        logging.warning("未找到可用的中文字体，中文可能显示为方框")
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+    matplotlib.rcParams['axes.unicode_minus'] = False
+    
+    return font_name
 
 
 def get_available_chinese_fonts():
@@ -52,23 +55,8 @@ def get_available_chinese_fonts():
         list: 中文字体名称列表
     """
     try:
-        font_list = [f.name for f in fm.fontManager.ttflist]
-        
-        # 常见中文字体关键词
-        chinese_keywords = [
-            'Chinese', 'CJK', 'Han', 'Hei', 'Song', 'Kai', 'Fang',
-            'PingFang', 'Hiragino', 'STHeiti', 'SimHei', 'Microsoft YaHei',
-            'WenQuanYi', 'Noto', 'Source'
-        ]
-        
-        chinese_fonts = []
-        for font in font_list:
-            for keyword in chinese_keywords:
-                if keyword in font:
-                    chinese_fonts.append(font)
-                    break
-        
-        return list(set(chinese_fonts))  # 去重
+        # 集合推导同时完成匹配与去重
+        return list({f.name for f in fm.fontManager.ttflist if CHINESE_FONT_PATTERN.search(f.name)})
         
     except Exception as e:
         logging.warning(f"获取中文字体列表时出错: {e}")
@@ -80,7 +68,7 @@ def print_font_info():
     print("=== 字体信息 ===")
     
     # 当前设置的字体
-    current_font = plt.rcParams['font.sans-serif']
+    current_font = matplotlib.rcParams['font.sans-serif']
     print(f"当前设置字体: {current_font}")
     
     # 可用的中文字体
@@ -102,8 +90,8 @@ def create_font_test_chart():
     创建字体测试图表
     用于检验中文字体是否正确显示
     """
+    # pyplot 只有绘图时才需要，延迟导入以免拖慢仅设置字体的调用方
     import matplotlib.pyplot as plt
-    import numpy as np
     
     # 设置字体
     font_name = setup_chinese_font()
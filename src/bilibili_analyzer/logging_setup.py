@@ -0,0 +1,79 @@
+"""
+日志配置模块
+所有组件共用一套经队列转发的日志处理器
+"""
+
+import atexit
+import logging
+import os
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from typing import List, Optional
+
+from .config import DATA_STORAGE
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 各组件的日志额外写入各自的文件
+COMPONENT_LOG_FILES = {
+    'BilibiliAnalyzer': 'main.log',
+    'BilibiliDataCollector': 'collector.log',
+    'ExecutionDataAnalyzer': 'analyzer.log',
+    'ExecutionDataVisualizer': 'visualizer.log',
+}
+
+# httpx 及其 HTTP/2 依赖会以 INFO 级别记录每个请求，只保留警告以上
+QUIET_LOGGERS = ('httpx', 'httpcore', 'h2', 'hpack')
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(level: Optional[int] = None) -> None:
+    """
+    配置根日志记录器
+    
+    首次调用时在根记录器上安装 QueueHandler，文件与控制台写入由 QueueListener
+    的后台线程完成，调用方只需入队。之后的调用只在显式传入 level 时调整级别。
+    
+    Args:
+        level: 日志级别，首次调用时默认为 INFO
+    """
+    global _listener
+    root = logging.getLogger()
+    
+    if _listener is None:
+        logs_dir = DATA_STORAGE['logs_dir']
+        os.makedirs(logs_dir, exist_ok=True)
+        
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers: List[logging.Handler] = [
+            logging.StreamHandler(),
+            logging.FileHandler(os.path.join(logs_dir, 'bilibili_analyzer.log'), encoding='utf-8', delay=True)
+        ]
+        for name, filename in COMPONENT_LOG_FILES.items():
+            file_handler = logging.FileHandler(os.path.join(logs_dir, filename), encoding='utf-8', delay=True)
+            file_handler.addFilter(logging.Filter(name))
+            handlers.append(file_handler)
+        
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue: "Queue[logging.LogRecord]" = Queue(-1)
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        
+        # atexit后注册先执行：先停止监听线程写完剩余日志，再关闭文件释放句柄
+        for handler in handlers:
+            atexit.register(handler.close)
+        atexit.register(_listener.stop)
+        
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(level if level is not None else logging.INFO)
+        
+        for name in QUIET_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
+        # jieba 自带输出到 stderr 的处理器，不再向根记录器传播以免重复输出
+        logging.getLogger('jieba').propagate = False
+    elif level is not None:
+        root.setLevel(level)
@@ -11,54 +11,59 @@ import argparse
 import time
 from datetime import datetime
 import logging
-from typing import Optional, Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
-from .data_collector import BilibiliDataCollector
-from .data_analyzer import DataAnalyzer
-from .visualizer import Visualizer
 from .config import DATA_STORAGE, SEARCH_KEYWORDS, DATE_RANGE
+from .logging_setup import configure_logging
+
+if TYPE_CHECKING:
+    from .data_analyzer import DataAnalyzer
+    from .visualizer import Visualizer
 
 
 class BilibiliAnalyzer:
     """Main orchestrator for Bilibili content analysis workflow."""
     
     def __init__(self, config_path: Optional[str] = None, output_dir: Optional[str] = None):
-        self.logger = self._setup_logger()
+        # 各阶段模块依赖较重（httpx、jieba、matplotlib、seaborn等），在用到时才导入，
+        # 图表子进程以spawn方式重新导入入口模块时不会加载它们
+        from .data_collector import BilibiliDataCollector
+        
+        configure_logging()
+        self.logger = logging.getLogger('BilibiliAnalyzer')
         self.collector = BilibiliDataCollector()
-        self.analyzer = DataAnalyzer()
-        self.visualizer = Visualizer()
         self.output_dir = output_dir or DATA_STORAGE['output_dir']
         self._ensure_directories()
     
-    def _setup_logger(self) -> logging.Logger:
-        """Setup main application logger."""
-        logger = logging.getLogger('BilibiliAnalyzer')
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            log_file = os.path.join(DATA_STORAGE['logs_dir'], 'main.log')
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-            
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
-        
-        return logger
+    @cached_property
+    def analyzer(self) -> 'DataAnalyzer':
+        """Data analyzer, created on first use so collect-only runs skip jieba and textblob."""
+        from .data_analyzer import DataAnalyzer
+        return DataAnalyzer()
+    
+    @cached_property
+    def visualizer(self) -> 'Visualizer':
+        """Chart generator, created on first use so non-visualize runs skip matplotlib and seaborn."""
+        from .visualizer import Visualizer
+        return Visualizer()
     
     def _ensure_directories(self):
         """Ensure all necessary directories exist."""
         for dir_path in DATA_STORAGE.values():
             os.makedirs(dir_path, exist_ok=True)
     
+    def validate_config(self):
+        """Check that the search configuration is usable.
+        
+        Raises:
+            ValueError: If no keywords are configured or the date range is empty
+        """
+        if not SEARCH_KEYWORDS:
+            raise ValueError("SEARCH_KEYWORDS is empty")
+        if DATE_RANGE['start_timestamp'] >= DATE_RANGE['end_timestamp']:
+            raise ValueError("DATE_RANGE start_timestamp must be earlier than end_timestamp")
+    
     def collect_only(self, force_recollect: bool = False) -> bool:
         """Run data collection only.
         
@@ -72,13 +77,22 @@ class BilibiliAnalyzer:
         print("Starting Data Collection Phase")
         print("="*60)
         
-        enhanced_data_file = os.path.join(DATA_STORAGE['processed_data_dir'], 'enhanced_videos_data.csv')
+        # Earlier runs wrote the enhanced dataset as CSV; either format counts as existing data
+        enhanced_data_file = next(
+            (path for path in (self.collector.processed_dir / 'enhanced_videos_data.parquet',
+                               self.collector.processed_dir / 'enhanced_videos_data.csv')
+             if path.exists()),
+            None
+        )
         
-        if os.path.exists(enhanced_data_file) and not force_recollect:
+        if enhanced_data_file is not None and not force_recollect:
             print(f"Found existing data file: {enhanced_data_file}")
             print("Use --force-recollect to re-collect data")
             return True
         
+        if force_recollect:
+            self.collector.clear_cache()
+        
         self.logger.info("Starting data collection")
         start_time = time.time()
         
@@ -163,7 +177,9 @@ class BilibiliAnalyzer:
         start_time = time.time()
         
         try:
-            self.visualizer.generate_all_visualizations()
+            if not self.visualizer.generate_all_visualizations():
+                print("部分图表生成失败，详见日志")
+                return False
             
             elapsed_time = time.time() - start_time
             print(f"可视化生成完成！耗时: {elapsed_time:.1f} 秒")
@@ -226,7 +242,7 @@ class BilibiliAnalyzer:
         overall_start_time = time.time()
         
         # 数据采集
-        if not self.run_data_collection(force_recollect):
+        if not self.collect_only(force_recollect):
             print("数据采集失败，停止执行")
             return False
         
@@ -249,7 +265,7 @@ class BilibiliAnalyzer:
         print(f"结果文件位置: {DATA_STORAGE['output_dir']}")
         print("\n生成的文件:")
         print(f"   • 分析报告: analysis_report.json")
-        print(f"   • 数据文件: analyzed_data.csv, analyzed_data.xlsx")
+        print(f"   • 数据文件: analyzed_data.csv, analyzed_data.parquet, analyzed_data.xlsx")
         print(f"   • 图表目录: charts/")
         print(f"   • 交互式仪表板: charts/interactive_dashboard.html")
         
@@ -266,11 +282,11 @@ def main():
     
     args = parser.parse_args()
     
-    project = ExecutionAnalysisProject()
+    project = BilibiliAnalyzer()
     
     try:
         if args.mode == 'collect':
-            success = project.run_data_collection(args.force_recollect)
+            success = project.collect_only(args.force_recollect)
         elif args.mode == 'analyze':
             success = project.run_data_analysis()
         elif args.mode == 'visualize':
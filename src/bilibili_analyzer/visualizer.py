@@ -5,86 +5,262 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from wordcloud import WordCloud
-import json
+import pyarrow.csv as pacsv
+import matplotlib
+import matplotlib.font_manager as fm
+import matplotlib.style
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import FuncFormatter, MultipleLocator
+from matplotlib import cycler
+from PIL import Image, ImageDraw, ImageFont
+import orjson
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import logging
 
 from .config import DATA_STORAGE, VISUALIZATION_CONFIG
+from .logging_setup import configure_logging
+
+# plotly、wordcloud 与 seaborn 导入开销较大，只在生成对应图表时导入
+if TYPE_CHECKING:
+    from wordcloud import WordCloud
+
+# 情感类别的固定展示顺序、中文标签和配色，不依赖报告中字典的键顺序
+SENTIMENT_ORDER = ('positive', 'neutral', 'negative')
+SENTIMENT_LABELS = {'positive': '积极', 'neutral': '中性', 'negative': '消极'}
+SENTIMENT_PIE_COLORS = {'positive': '#99ff99', 'neutral': '#66b3ff', 'negative': '#ff9999'}
+SENTIMENT_BAR_COLORS = {'positive': 'green', 'neutral': 'gray', 'negative': 'red'}
+
+
+@lru_cache(maxsize=1)
+def _available_font_names() -> frozenset:
+    """扫描一次已注册的字体名称，后续实例直接复用"""
+    return frozenset(f.name for f in fm.fontManager.ttflist)
+
+
+def _render_chart(method_name: str, data_file: str, report: Dict):
+    """
+    在子进程中生成单组图表
+    
+    父进程加载数据后已保证 Parquet 为最新，子进程只读取该文件，
+    不再重复CSV解析和新旧判断，也避免向每个进程序列化整张DataFrame。
+    
+    Args:
+        method_name: Visualizer 上的图表方法名
+        data_file: 分析数据的 Parquet 文件路径
+        report: 分析报告
+    """
+    visualizer = Visualizer()
+    df = visualizer._read_parquet(data_file)
+    getattr(visualizer, method_name)(df, report)
 
 
 class Visualizer:
     """Data visualizer for Bilibili content analysis."""
     
     def __init__(self):
-        self.logger = self._setup_logger()
+        configure_logging()
+        self.logger = logging.getLogger('ExecutionDataVisualizer')
+        self.charts_dir = os.path.join(DATA_STORAGE['output_dir'], 'charts')
         self._setup_style()
         self._ensure_directories()
     
-    def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger('ExecutionDataVisualizer')
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            log_file = os.path.join(DATA_STORAGE['logs_dir'], 'visualizer.log')
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-            
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
-            
-        return logger
-    
     def _setup_style(self):
-        """设置绘图风格"""
-        import matplotlib.font_manager as fm
+        """
+        设置绘图风格
+        
+        使用matplotlib内置的seaborn whitegrid样式和按seaborn方式取样的配色，
+        效果与 sns.set_style/set_palette 相同，但不必为此导入seaborn及pyplot
+        """
+        matplotlib.style.use('seaborn-v0_8-whitegrid')
+        # 与 seaborn.color_palette 一致：在色图上等距取6色，去掉两端
+        palette = matplotlib.colormaps[VISUALIZATION_CONFIG['color_palette']](np.linspace(0, 1, 8)[1:-1])
+        matplotlib.rcParams['axes.prop_cycle'] = cycler(color=[tuple(rgb) for rgb in palette[:, :3]])
         
         # 尝试找到系统中可用的中文字体
         chinese_fonts = ['Arial Unicode MS', 'PingFang SC', 'Hiragino Sans GB', 'STHeiti', 'SimHei', 'Microsoft YaHei']
-        available_font = None
-        
-        for font_name in chinese_fonts:
-            try:
-                font_list = [f.name for f in fm.fontManager.ttflist]
-                if font_name in font_list:
-                    available_font = font_name
-                    break
-            except:
-                continue
+        font_names = _available_font_names()
+        available_font = next((font_name for font_name in chinese_fonts if font_name in font_names), None)
         
         if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
+            matplotlib.rcParams['font.sans-serif'] = [available_font]
             self.logger.info(f"使用字体: {available_font}")
         else:
-            plt.rcParams['font.sans-serif'] = ['DejaVu Sans']
+            matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans']
             self.logger.warning("未找到中文字体，图表中文可能显示为方框")
         
-        plt.rcParams['axes.unicode_minus'] = False
-        plt.rcParams['figure.figsize'] = VISUALIZATION_CONFIG['figure_size']
-        sns.set_style("whitegrid")
-        sns.set_palette(VISUALIZATION_CONFIG['color_palette'])
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        matplotlib.rcParams['figure.figsize'] = VISUALIZATION_CONFIG['figure_size']
     
     def _ensure_directories(self):
         """确保目录存在"""
-        charts_dir = os.path.join(DATA_STORAGE['output_dir'], 'charts')
-        os.makedirs(charts_dir, exist_ok=True)
+        os.makedirs(self.charts_dir, exist_ok=True)
+    
+    def _subplots(self, nrows: int = 1, ncols: int = 1, figsize: tuple = None) -> tuple:
+        """
+        创建绑定Agg画布的图形和子图
+        
+        直接使用面向对象API，不经过pyplot的全局图形注册表，也不会探测交互式后端。
+        
+        Args:
+            nrows: 子图行数
+            ncols: 子图列数
+            figsize: 图形尺寸
+            
+        Returns:
+            (Figure, Axes): 图形与子图（多个子图时为数组）
+        """
+        fig = Figure(figsize=figsize, constrained_layout=True)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(nrows, ncols)
+    
+    def _save_fig(self, fig: Figure, filename: str):
+        """
+        保存图表到图表目录
+        
+        布局在创建图形时由 constrained_layout 完成，保存时不再做 tight_layout 和 bbox 裁剪。
+        PNG 使用低压缩级别，以少量体积换取更快的编码。
+        图形不在pyplot注册表中，无需 close，随引用释放。
+        
+        Args:
+            fig: matplotlib图形
+            filename: 文件名
+        """
+        fig.savefig(
+            os.path.join(self.charts_dir, filename),
+            dpi=VISUALIZATION_CONFIG['dpi'],
+            pil_kwargs={'compress_level': VISUALIZATION_CONFIG['png_compress_level']}
+        )
+    
+    def _save_wordcloud(self, wordcloud: 'WordCloud', title: str, filename: str):
+        """
+        在词云图上方加标题栏并保存为PNG
+        
+        Args:
+            wordcloud: 已生成的词云
+            title: 标题文字
+            filename: 文件名
+        """
+        cloud_image = wordcloud.to_image()
+        banner_height = max(40, cloud_image.height // 8)
+        
+        # 标题使用与图表相同的中文字体
+        font_path = (VISUALIZATION_CONFIG['wordcloud_config'].get('font_path') or
+                     fm.findfont(fm.FontProperties(family=matplotlib.rcParams['font.sans-serif'])))
+        font = ImageFont.truetype(font_path, size=banner_height // 2)
+        
+        image = Image.new('RGB', (cloud_image.width, cloud_image.height + banner_height), 'white')
+        image.paste(cloud_image, (0, banner_height))
+        ImageDraw.Draw(image).text((cloud_image.width // 2, banner_height // 2), title,
+                                   fill='black', font=font, anchor='mm')
+        image.save(os.path.join(self.charts_dir, filename), compress_level=VISUALIZATION_CONFIG['png_compress_level'])
+    
+    @staticmethod
+    def _sorted_by_year(data: Dict) -> list:
+        """
+        按年份数值排序报告中以年份为键的数据
+        
+        Args:
+            data: 以年份字符串为键的字典
+            
+        Returns:
+            按年份升序的 (年份, 数据) 列表
+        """
+        return sorted(data.items(), key=lambda item: int(item[0]))
+    
+    @staticmethod
+    def _format_count(value: float) -> str:
+        """
+        将计数格式化为带 K/M 后缀的简短标签
+        
+        Args:
+            value: 计数值
+            
+        Returns:
+            格式化后的标签
+        """
+        if value >= 1000000:
+            return f'{value/1000000:.1f}M'
+        if value >= 1000:
+            return f'{value/1000:.0f}K'
+        return str(int(value))
+    
+    @property
+    def parquet_file(self) -> str:
+        """分析数据的 Parquet 文件路径"""
+        return os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.parquet')
+    
+    @staticmethod
+    def _read_parquet(parquet_file: str) -> pd.DataFrame:
+        """
+        读取分析数据的 Parquet 文件
+        
+        Args:
+            parquet_file: 文件路径
+            
+        Returns:
+            DataFrame
+        """
+        return Visualizer._add_pubdate_datetime(pd.read_parquet(parquet_file, engine='pyarrow'))
+    
+    @staticmethod
+    def _add_pubdate_datetime(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        由发布时间戳生成日期列，缺失或无法解析的时间戳为 NaT
+        
+        Args:
+            df: 分析数据
+            
+        Returns:
+            添加 pubdate_datetime 列后的DataFrame
+        """
+        df['pubdate_datetime'] = pd.to_datetime(pd.to_numeric(df['pubdate'], errors='coerce'),
+                                                unit='s', errors='coerce')
+        return df
+    
+    def load_data(self) -> pd.DataFrame:
+        """
+        加载分析数据
+        
+        Returns:
+            DataFrame
+        """
+        data_file = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.csv')
+        parquet_file = self.parquet_file
+        
+        if os.path.exists(parquet_file) and (not os.path.exists(data_file) or
+                                             os.path.getmtime(parquet_file) >= os.path.getmtime(data_file)):
+            # Parquet不比CSV旧时直接读取，跳过CSV解析
+            return self._read_parquet(parquet_file)
+        elif not os.path.exists(data_file):
+            self.logger.error(f"数据文件不存在: {data_file}")
+            return pd.DataFrame()
+        
+        try:
+            # PyArrow多线程解析CSV（简介等字段可能跨行），并写出Parquet供下次直接读取
+            df = pacsv.read_csv(
+                data_file,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True)
+            ).to_pandas()
+        except Exception as e:
+            self.logger.error(f"加载数据失败: {e}")
+            return pd.DataFrame()
+        
+        try:
+            df.to_parquet(parquet_file, engine='pyarrow', index=False)
+        except Exception as e:
+            # 写出失败时删除残留文件，避免之后读到旧数据
+            self.logger.warning(f"写出Parquet缓存失败: {e}")
+            if os.path.exists(parquet_file):
+                os.remove(parquet_file)
+        
+        return self._add_pubdate_datetime(df)
     
     def load_data_and_report(self) -> tuple:
         """
@@ -93,20 +269,13 @@ class Visualizer:
         Returns:
             (DataFrame, Dict): 数据和报告的元组
         """
-        # 加载数据
-        data_file = os.path.join(DATA_STORAGE['output_dir'], 'analyzed_data.csv')
-        if os.path.exists(data_file):
-            df = pd.read_csv(data_file, encoding='utf-8-sig')
-            df['pubdate_datetime'] = pd.to_datetime(df['pubdate'], unit='s', errors='coerce')
-        else:
-            self.logger.error(f"数据文件不存在: {data_file}")
-            df = pd.DataFrame()
+        df = self.load_data()
         
         # 加载报告
         report_file = os.path.join(DATA_STORAGE['output_dir'], 'analysis_report.json')
         if os.path.exists(report_file):
-            with open(report_file, 'r', encoding='utf-8') as f:
-                report = json.load(f)
+            with open(report_file, 'rb') as f:
+                report = orjson.loads(f.read())
         else:
             self.logger.error(f"报告文件不存在: {report_file}")
             report = {}
@@ -124,13 +293,14 @@ class Visualizer:
         self.logger.info("创建时间趋势图表")
         
         # 1. 年度视频数量趋势
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(2, 2, figsize=(15, 12))
         
         yearly_data = report.get('time_trends', {}).get('yearly_trends', {})
         if yearly_data:
-            years = list(yearly_data.keys())
-            video_counts = [yearly_data[year]['video_count'] for year in years]
-            avg_views = [yearly_data[year]['avg_views'] for year in years]
+            years, video_counts, avg_views, engagement_rates = zip(*(
+                (year, stats['video_count'], stats['avg_views'], stats.get('avg_engagement_rate', 0))
+                for year, stats in self._sorted_by_year(yearly_data)
+            ))
             
             # 视频数量趋势
             ax1.plot(years, video_counts, marker='o', linewidth=2, markersize=8)
@@ -145,33 +315,37 @@ class Visualizer:
             ax2.set_xlabel('年份')
             ax2.set_ylabel('平均播放量')
             ax2.grid(True, alpha=0.3)
-            ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K' if x >= 1000 else f'{x:.0f}'))
+            ax2.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x/1000:.0f}K' if x >= 1000 else f'{x:.0f}'))
         
         # 3. 月度发布量热力图
-        if not df.empty and 'pubdate_datetime' in df.columns:
-            df['year'] = df['pubdate_datetime'].dt.year
-            df['month'] = df['pubdate_datetime'].dt.month
-            monthly_counts = df.groupby(['year', 'month']).size().reset_index(name='count')
-            pivot_data = monthly_counts.pivot(index='year', columns='month', values='count').fillna(0)
-            
-            sns.heatmap(pivot_data, annot=True, fmt='.0f', cmap='YlOrRd', ax=ax3)
+        pubdates = df['pubdate_datetime'].dropna() if 'pubdate_datetime' in df.columns else pd.Series(dtype='datetime64[ns]')
+        if not pubdates.empty:
+            # seaborn 及其依赖的pyplot只在绘制热力图时导入
+            import seaborn as sns
+            
+            # 年月网格很小，直接按 (年, 月) 的扁平下标计数，不经过 groupby/pivot
+            pub_years = pubdates.dt.year.to_numpy()
+            pub_months = pubdates.dt.month.to_numpy()
+            first_year, last_year = pub_years.min(), pub_years.max()
+            counts = np.bincount((pub_years - first_year) * 12 + (pub_months - 1),
+                                 minlength=(last_year - first_year + 1) * 12).reshape(-1, 12)
+            # 计数本身为整数，按整数格式标注，无需经过浮点格式化
+            pivot_data = pd.DataFrame(counts.astype(np.int32), index=range(first_year, last_year + 1), columns=range(1, 13))
+            
+            sns.heatmap(pivot_data, annot=True, fmt='d', cmap='YlOrRd', ax=ax3)
             ax3.set_title('月度发布量热力图', fontsize=14, fontweight='bold')
             ax3.set_xlabel('月份')
             ax3.set_ylabel('年份')
         
         # 4. 参与度趋势
         if yearly_data:
-            engagement_rates = [yearly_data[year].get('avg_engagement_rate', 0) for year in years]
             ax4.plot(years, engagement_rates, marker='^', linewidth=2, markersize=8, color='green')
             ax4.set_title('年度平均参与度趋势', fontsize=14, fontweight='bold')
             ax4.set_xlabel('年份')
             ax4.set_ylabel('参与度 (%)')
             ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(DATA_STORAGE['output_dir'], 'charts', 'time_trends_detailed.png'), 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_fig(fig, 'time_trends_detailed.png')
         
         self.logger.info("时间趋势图表已保存")
     
@@ -185,27 +359,25 @@ class Visualizer:
         """
         self.logger.info("创建情感分析图表")
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(2, 2, figsize=(15, 12))
         
         sentiment_data = report.get('sentiment_analysis', {})
         
         # 1. 情感分布饼图
         sentiment_dist = sentiment_data.get('sentiment_distribution', {})
-        if sentiment_dist:
-            colors = ['#ff9999', '#66b3ff', '#99ff99']
-            labels = {'positive': '积极', 'neutral': '中性', 'negative': '消极'}
-            
-            plot_labels = [labels.get(k, k) for k in sentiment_dist.keys()]
-            ax1.pie(sentiment_dist.values(), labels=plot_labels, autopct='%1.1f%%', 
-                   colors=colors, startangle=90)
+        keys = [k for k in SENTIMENT_ORDER if k in sentiment_dist]
+        if keys:
+            ax1.pie([sentiment_dist[k] for k in keys], labels=[SENTIMENT_LABELS[k] for k in keys],
+                   autopct='%1.1f%%', colors=[SENTIMENT_PIE_COLORS[k] for k in keys], startangle=90)
             ax1.set_title('情感态度分布', fontsize=14, fontweight='bold')
         
         # 2. 年度情感变化
         yearly_sentiment = sentiment_data.get('yearly_sentiment', {})
         if yearly_sentiment:
-            years = list(yearly_sentiment.keys())
-            positive_pct = [yearly_sentiment[year].get('positive', 0) for year in years]
-            negative_pct = [yearly_sentiment[year].get('negative', 0) for year in years]
+            years, positive_pct, negative_pct = zip(*(
+                (year, stats.get('positive', 0), stats.get('negative', 0))
+                for year, stats in self._sorted_by_year(yearly_sentiment)
+            ))
             
             ax2.plot(years, positive_pct, marker='o', label='积极', linewidth=2)
             ax2.plot(years, negative_pct, marker='s', label='消极', linewidth=2)
@@ -217,36 +389,29 @@ class Visualizer:
         
         # 3. 情感与参与度关系
         sentiment_engagement = sentiment_data.get('sentiment_engagement', {})
-        if sentiment_engagement:
-            sentiments = list(sentiment_engagement.keys())
+        sentiments = [s for s in SENTIMENT_ORDER if s in sentiment_engagement]
+        if sentiments:
             engagement_rates = [sentiment_engagement[s]['engagement_rate'] for s in sentiments]
             
-            colors_map = {'positive': 'green', 'neutral': 'gray', 'negative': 'red'}
-            colors = [colors_map.get(s, 'blue') for s in sentiments]
-            
-            bars = ax3.bar([labels.get(s, s) for s in sentiments], engagement_rates, color=colors, alpha=0.7)
+            bars = ax3.bar([SENTIMENT_LABELS[s] for s in sentiments], engagement_rates,
+                           color=[SENTIMENT_BAR_COLORS[s] for s in sentiments], alpha=0.7)
             ax3.set_title('情感态度与参与度关系', fontsize=14, fontweight='bold')
             ax3.set_ylabel('平均参与度 (%)')
             
             # 添加数值标签
-            for bar, rate in zip(bars, engagement_rates):
-                ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                        f'{rate:.3f}%', ha='center', va='bottom')
+            ax3.bar_label(bars, labels=[f'{rate:.3f}%' for rate in engagement_rates], padding=3)
         
         # 4. 情感分数分布
         if not df.empty and 'sentiment_score' in df.columns:
+            mean_sentiment = float(df['sentiment_score'].mean())
             ax4.hist(df['sentiment_score'], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
             ax4.set_title('情感分数分布', fontsize=14, fontweight='bold')
             ax4.set_xlabel('情感分数 (0-1, 越大越积极)')
             ax4.set_ylabel('视频数量')
-            ax4.axvline(df['sentiment_score'].mean(), color='red', linestyle='--', 
-                       label=f'平均值: {df["sentiment_score"].mean():.3f}')
+            ax4.axvline(mean_sentiment, color='red', linestyle='--', label=f'平均值: {mean_sentiment:.3f}')
             ax4.legend()
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(DATA_STORAGE['output_dir'], 'charts', 'sentiment_analysis.png'), 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_fig(fig, 'sentiment_analysis.png')
         
         self.logger.info("情感分析图表已保存")
     
@@ -265,28 +430,22 @@ class Visualizer:
         top_keywords = content_themes.get('top_keywords', [])
         
         if top_keywords:
+            from wordcloud import WordCloud
+            
             # 准备词云数据
             word_freq = {word: weight for word, weight in top_keywords}
             
             # 生成词云
             wordcloud = WordCloud(**VISUALIZATION_CONFIG['wordcloud_config']).generate_from_frequencies(word_freq)
             
-            plt.figure(figsize=(12, 8))
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title('执行力相关内容关键词云', fontsize=16, fontweight='bold', pad=20)
-            plt.tight_layout()
-            plt.savefig(os.path.join(DATA_STORAGE['output_dir'], 'charts', 'wordcloud.png'), 
-                       dpi=300, bbox_inches='tight')
-            plt.close()
+            # 直接由PIL保存，不经过matplotlib的图像管线
+            self._save_wordcloud(wordcloud, '执行力相关内容关键词云', 'wordcloud.png')
         
         # 2. 热门关键词条形图
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig, (ax1, ax2) = self._subplots(1, 2, figsize=(16, 8))
         
         if top_keywords:
-            top_20_keywords = top_keywords[:20]
-            words = [item[0] for item in top_20_keywords]
-            weights = [item[1] for item in top_20_keywords]
+            words, weights = map(list, zip(*top_keywords[:20]))
             
             y_pos = np.arange(len(words))
             bars = ax1.barh(y_pos, weights, color='skyblue', alpha=0.8)
@@ -297,18 +456,15 @@ class Visualizer:
             ax1.grid(axis='x', alpha=0.3)
             
             # 添加数值标签
-            for i, (bar, weight) in enumerate(zip(bars, weights)):
-                ax1.text(bar.get_width() + 0.01, bar.get_y() + bar.get_height()/2,
-                        f'{weight:.3f}', va='center', ha='left', fontsize=9)
+            ax1.bar_label(bars, labels=[f'{weight:.3f}' for weight in weights], padding=3, fontsize=9)
         
         # 3. 热门标签
         top_tags = content_themes.get('top_tags', [])
         if top_tags:
-            top_15_tags = top_tags[:15]
-            tag_names = [item[0] for item in top_15_tags if item[0]]  # 过滤空标签
-            tag_counts = [item[1] for item in top_15_tags if item[0]]
+            top_15_tags = [item for item in top_tags[:15] if item[0]]  # 过滤空标签
             
-            if tag_names:
+            if top_15_tags:
+                tag_names, tag_counts = map(list, zip(*top_15_tags))
                 y_pos = np.arange(len(tag_names))
                 bars = ax2.barh(y_pos, tag_counts, color='lightcoral', alpha=0.8)
                 ax2.set_yticks(y_pos)
@@ -318,14 +474,9 @@ class Visualizer:
                 ax2.grid(axis='x', alpha=0.3)
                 
                 # 添加数值标签
-                for bar, count in zip(bars, tag_counts):
-                    ax2.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
-                            str(count), va='center', ha='left', fontsize=9)
+                ax2.bar_label(bars, labels=[str(count) for count in tag_counts], padding=3, fontsize=9)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(DATA_STORAGE['output_dir'], 'charts', 'content_analysis.png'), 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_fig(fig, 'content_analysis.png')
         
         self.logger.info("内容分析图表已保存")
     
@@ -339,29 +490,38 @@ class Visualizer:
         """
         self.logger.info("创建参与度分析图表")
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(2, 2, figsize=(15, 12))
         
         engagement_data = report.get('engagement_patterns', {})
         
         # 1. 参与度分布直方图
         if not df.empty and 'engagement_rate' in df.columns:
-            # 过滤异常值
-            engagement_clean = df['engagement_rate'][df['engagement_rate'] < df['engagement_rate'].quantile(0.99)]
+            # 过滤异常值：np.partition 线性时间取99%分位，无需整列排序
+            engagement = df['engagement_rate'].to_numpy(dtype=float)
+            engagement = engagement[~np.isnan(engagement)]
+            if engagement.size:
+                k = min(int(engagement.size * 0.99), engagement.size - 1)
+                threshold = np.partition(engagement, k)[k]
+                engagement_clean = engagement[engagement < threshold]
+            else:
+                engagement_clean = engagement
+            mean_engagement = engagement_clean.mean() if engagement_clean.size else 0.0
             
             ax1.hist(engagement_clean, bins=50, alpha=0.7, color='lightblue', edgecolor='black')
             ax1.set_title('参与度分布', fontsize=14, fontweight='bold')
             ax1.set_xlabel('参与度 (%)')
             ax1.set_ylabel('视频数量')
-            ax1.axvline(engagement_clean.mean(), color='red', linestyle='--', 
-                       label=f'平均值: {engagement_clean.mean():.3f}%')
+            ax1.axvline(mean_engagement, color='red', linestyle='--', 
+                       label=f'平均值: {mean_engagement:.3f}%')
             ax1.legend()
         
         # 2. 年度参与度变化
         engagement_by_year = engagement_data.get('engagement_by_year', {})
         if engagement_by_year:
-            years = list(engagement_by_year.keys())
-            avg_engagement = [engagement_by_year[year]['engagement_rate']['mean'] for year in years]
-            avg_views = [engagement_by_year[year]['view']['mean'] for year in years]
+            years, avg_engagement, avg_views = zip(*(
+                (year, stats['engagement_rate']['mean'], stats['view']['mean'])
+                for year, stats in self._sorted_by_year(engagement_by_year)
+            ))
             
             ax2_twin = ax2.twinx()
             
@@ -382,21 +542,21 @@ class Visualizer:
         
         # 3. 播放量vs参与度散点图
         if not df.empty:
-            # 取样本避免图表过于密集
-            sample_size = min(1000, len(df))
-            sample_df = df.sample(n=sample_size) if len(df) > sample_size else df
-            
-            scatter = ax3.scatter(sample_df['view'], sample_df['engagement_rate'], 
-                                alpha=0.6, c=sample_df['sentiment_score'], 
-                                cmap='RdYlBu', s=30)
+            # 六边形分箱聚合全部数据，绘制成本只取决于网格大小，结果不随抽样变化
+            log_views = np.log10(df['view'].clip(lower=1).to_numpy(dtype=float))
+            hexbin = ax3.hexbin(log_views, df['engagement_rate'].to_numpy(dtype=float),
+                                C=df['sentiment_score'].to_numpy(dtype=float),
+                                reduce_C_function=np.mean, gridsize=60, cmap='RdYlBu', mincnt=1)
             ax3.set_title('播放量 vs 参与度', fontsize=14, fontweight='bold')
             ax3.set_xlabel('播放量')
+            # 横轴为log10值，刻度取整数次幂并还原为播放量标注
+            ax3.xaxis.set_major_locator(MultipleLocator(1))
+            ax3.xaxis.set_major_formatter(FuncFormatter(lambda x, p: self._format_count(10 ** x)))
             ax3.set_ylabel('参与度 (%)')
-            ax3.set_xscale('log')
             
             # 添加颜色条
-            cbar = plt.colorbar(scatter, ax=ax3)
-            cbar.set_label('情感分数')
+            cbar = fig.colorbar(hexbin, ax=ax3)
+            cbar.set_label('平均情感分数')
         
         # 4. 时长与参与度关系（如果有数据）
         duration_engagement = engagement_data.get('duration_engagement', {})
@@ -411,14 +571,9 @@ class Visualizer:
             ax4.tick_params(axis='x', rotation=45)
             
             # 添加数值标签
-            for bar, rate in zip(bars, engagement_rates):
-                ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                        f'{rate:.3f}%', ha='center', va='bottom', fontsize=9)
+            ax4.bar_label(bars, labels=[f'{rate:.3f}%' for rate in engagement_rates], padding=3, fontsize=9)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(DATA_STORAGE['output_dir'], 'charts', 'engagement_analysis.png'), 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_fig(fig, 'engagement_analysis.png')
         
         self.logger.info("参与度分析图表已保存")
     
@@ -432,7 +587,7 @@ class Visualizer:
         """
         self.logger.info("创建作者分析图表")
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig, (ax1, ax2) = self._subplots(1, 2, figsize=(16, 8))
         
         content_themes = report.get('content_themes', {})
         top_authors = content_themes.get('top_authors', {})
@@ -450,9 +605,7 @@ class Visualizer:
             ax1.set_title('最活跃的执行力内容创作者 (Top 15)', fontsize=14, fontweight='bold')
             
             # 添加数值标签
-            for bar, count in zip(bars1, video_counts):
-                ax1.text(bar.get_width() + 0.1, bar.get_y() + bar.get_height()/2,
-                        str(count), va='center', ha='left', fontsize=9)
+            ax1.bar_label(bars1, labels=[str(count) for count in video_counts], padding=3, fontsize=9)
         
         # 2. 作者影响力（总播放量）
         if top_authors:
@@ -465,21 +618,9 @@ class Visualizer:
             ax2.set_title('最具影响力的执行力内容创作者 (Top 15)', fontsize=14, fontweight='bold')
             
             # 添加数值标签
-            for bar, views in zip(bars2, total_views):
-                if views >= 1000000:
-                    label = f'{views/1000000:.1f}M'
-                elif views >= 1000:
-                    label = f'{views/1000:.0f}K'
-                else:
-                    label = str(int(views))
-                
-                ax2.text(bar.get_width() + max(total_views)*0.01, bar.get_y() + bar.get_height()/2,
-                        label, va='center', ha='left', fontsize=9)
+            ax2.bar_label(bars2, labels=[self._format_count(views) for views in total_views], padding=3, fontsize=9)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(DATA_STORAGE['output_dir'], 'charts', 'author_analysis.png'), 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_fig(fig, 'author_analysis.png')
         
         self.logger.info("作者分析图表已保存")
     
@@ -493,21 +634,25 @@ class Visualizer:
         """
         self.logger.info("创建交互式仪表板")
         
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         # 创建子图
         fig = make_subplots(
             rows=3, cols=2,
             subplot_titles=('年度趋势', '情感分布', '月度热力图', '关键词排行', '参与度分布', '作者影响力'),
             specs=[[{"secondary_y": True}, {"type": "pie"}],
                    [{"type": "heatmap"}, {"type": "bar"}],
-                   [{"type": "histogram"}, {"type": "bar"}]]
+                   [{"type": "bar"}, {"type": "bar"}]]
         )
         
         # 1. 年度趋势
         yearly_data = report.get('time_trends', {}).get('yearly_trends', {})
         if yearly_data:
-            years = list(yearly_data.keys())
-            video_counts = [yearly_data[year]['video_count'] for year in years]
-            avg_views = [yearly_data[year]['avg_views'] for year in years]
+            years, video_counts, avg_views = zip(*(
+                (year, stats['video_count'], stats['avg_views'])
+                for year, stats in self._sorted_by_year(yearly_data)
+            ))
             
             fig.add_trace(
                 go.Scatter(x=years, y=video_counts, name='视频数量', line=dict(color='blue')),
@@ -520,19 +665,23 @@ class Visualizer:
         
         # 2. 情感分布饼图
         sentiment_dist = report.get('sentiment_analysis', {}).get('sentiment_distribution', {})
-        if sentiment_dist:
-            labels = {'positive': '积极', 'neutral': '中性', 'negative': '消极'}
+        keys = [k for k in SENTIMENT_ORDER if k in sentiment_dist]
+        if keys:
             fig.add_trace(
-                go.Pie(labels=[labels.get(k, k) for k in sentiment_dist.keys()], 
-                      values=list(sentiment_dist.values()),
-                      name="情感分布"),
+                go.Pie(labels=[SENTIMENT_LABELS[k] for k in keys],
+                      values=[sentiment_dist[k] for k in keys],
+                      marker=dict(colors=[SENTIMENT_PIE_COLORS[k] for k in keys]),
+                      sort=False, name="情感分布"),
                 row=1, col=2
             )
         
         # 3. 参与度分布
         if not df.empty and 'engagement_rate' in df.columns:
+            # 在本地分箱后只传30个柱子，HTML中不再嵌入整列数据
+            engagement = df['engagement_rate'].to_numpy(dtype=float)
+            counts, edges = np.histogram(engagement[~np.isnan(engagement)], bins=30)
             fig.add_trace(
-                go.Histogram(x=df['engagement_rate'], name='参与度分布', nbinsx=30),
+                go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name='参与度分布'),
                 row=3, col=1
             )
         
@@ -549,9 +698,14 @@ class Visualizer:
         
         self.logger.info("交互式仪表板已保存")
     
-    def generate_all_visualizations(self):
+    def generate_all_visualizations(self) -> bool:
         """
         生成所有可视化图表
+        
+        各组图表互相独立，单组失败只记录日志，其余图表照常生成。
+        
+        Returns:
+            bool: 全部图表生成成功返回 True
         """
         self.logger.info("开始生成所有可视化图表")
         
@@ -560,36 +714,60 @@ class Visualizer:
         
         if df.empty or not report:
             self.logger.error("数据或报告为空，无法生成图表")
-            return
-        
-        try:
-            # 生成各种图表
-            self.create_time_trend_charts(df, report)
-            self.create_sentiment_charts(df, report)
-            self.create_content_analysis_charts(df, report)
-            self.create_engagement_charts(df, report)
-            self.create_author_analysis_charts(df, report)
-            self.create_interactive_dashboard(df, report)
-            
+            return False
+        
+        chart_methods = [
+            'create_time_trend_charts',
+            'create_sentiment_charts',
+            'create_content_analysis_charts',
+            'create_engagement_charts',
+            'create_author_analysis_charts',
+            'create_interactive_dashboard',
+        ]
+        max_workers = min(len(chart_methods), os.cpu_count() or 1)
+        
+        failed = []
+        if max_workers > 1 and os.path.exists(self.parquet_file):
+            # 各组图表互不依赖，按进程并行渲染；spawn 避免子进程继承父进程的日志线程和绘图状态
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {method_name: executor.submit(_render_chart, method_name, self.parquet_file, report)
+                           for method_name in chart_methods}
+                for method_name, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.exception(f"{method_name} 生成失败: {e}")
+                        failed.append(method_name)
+        else:
+            for method_name in chart_methods:
+                try:
+                    getattr(self, method_name)(df, report)
+                except Exception as e:
+                    self.logger.exception(f"{method_name} 生成失败: {e}")
+                    failed.append(method_name)
+        
+        if failed:
+            self.logger.error(f"{len(failed)}/{len(chart_methods)} 组图表生成失败: {', '.join(failed)}")
+        else:
             self.logger.info("所有可视化图表生成完成")
-            print("\n=== 可视化图表生成完成 ===")
-            print(f"图表保存位置: {os.path.join(DATA_STORAGE['output_dir'], 'charts')}")
-            print("生成的图表包括:")
-            print("- time_trends_detailed.png: 时间趋势详细分析")
-            print("- sentiment_analysis.png: 情感态度分析")
-            print("- content_analysis.png: 内容主题分析")
-            print("- engagement_analysis.png: 参与度分析")
-            print("- author_analysis.png: 作者影响力分析")
-            print("- wordcloud.png: 关键词云图")
-            print("- interactive_dashboard.html: 交互式仪表板")
-            
-        except Exception as e:
-            self.logger.error(f"生成可视化图表时出错: {e}")
-
+        
+        print("\n=== 可视化图表生成完成 ===")
+        print(f"图表保存位置: {os.path.join(DATA_STORAGE['output_dir'], 'charts')}")
+        print("生成的图表包括:")
+        print("- time_trends_detailed.png: 时间趋势详细分析")
+        print("- sentiment_analysis.png: 情感态度分析")
+        print("- content_analysis.png: 内容主题分析")
+        print("- engagement_analysis.png: 参与度分析")
+        print("- author_analysis.png: 作者影响力分析")
+        print("- wordcloud.png: 关键词云图")
+        print("- interactive_dashboard.html: 交互式仪表板")
+        
+        return not failed
 
 def main():
     """主函数"""
-    visualizer = ExecutionDataVisualizer()
+    visualizer = Visualizer()
     visualizer.generate_all_visualizations()
 
 